@@ -0,0 +1,23 @@
+-- Append-only worker log writes: one round-trip per append instead of select + update
+-- with the whole log_text going both ways (called by the worker's sb_append_log).
+
+create or replace function public.append_job_log(jid uuid, t text, max_chars integer default 20000)
+returns void
+language sql
+security definer
+set search_path = public
+as $$
+  update public.clip_jobs
+  set log_text = right(
+        case
+          when coalesce(log_text, '') = '' or right(log_text, 1) = E'\n' then coalesce(log_text, '')
+          else log_text || E'\n'
+        end || t,
+        max_chars
+      ),
+      updated_at = now()
+  where id = jid;
+$$;
+
+revoke all on function public.append_job_log(uuid, text, integer) from public;
+grant execute on function public.append_job_log(uuid, text, integer) to service_role;
@@ -9,7 +9,7 @@ time window, and finally stitch everything back together.
 Free-tier safe defaults:
 - DISABLE_XTTS=1 (no Coqui)
 - ENABLE_LOCAL_NLLB=0 (no local transformers)
-- TTS uses edge-tts (with espeak-ng fallback)
+- TTS uses edge-tts (with espeak-ng fallback); TTS_PROVIDER=piper runs local Piper voices
 - Translation uses google_free (or LibreTranslate if configured)
 
 Main quality upgrades vs earlier versions:
@@ -22,28 +22,38 @@ Main quality upgrades vs earlier versions:
 
 import os
 import sys
+import errno
+import fcntl
+import stat
 import json
 import uuid
 import time
 import base64
+import hashlib
 import shutil
+import tempfile
 import subprocess
 import re
 import wave
 import math
+import itertools
+import sqlite3
+import importlib.util
 import numpy as np
-from decimal import Decimal  # NEW
 
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Set
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timezone
+from email.utils import formatdate
 import urllib.parse
 import urllib.request
 import threading
+import asyncio
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import PlainTextResponse, FileResponse, Response
+from fastapi.responses import PlainTextResponse, FileResponse, Response, JSONResponse, ORJSONResponse
 from pydantic import BaseModel, HttpUrl, Field
 from dotenv import load_dotenv
 from fastapi import Header
@@ -58,10 +68,42 @@ try:
 except Exception:
     requests = None
 
+# One pooled session for Storage REST and YouTube upload calls: keep-alive connections are reused
+# instead of a new TCP+TLS handshake per artifact transfer.
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))
+if requests is not None:
+    _HTTP = requests.Session()
+    _HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+    _HTTP.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+else:
+    _HTTP = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 load_dotenv()
 
-JOB_SEM = threading.Semaphore(1)
+# Jobs are queued in-process and drained by MAX_PARALLEL_JOBS long-lived workers.
+MAX_PARALLEL_JOBS = int(os.getenv("MAX_PARALLEL_JOBS", "1"))
+JOB_QUEUE: "asyncio.Queue[Tuple[str, str, bool]]" = asyncio.Queue()
+# Per-stage caps inside a job: network-bound yt-dlp vs CPU-bound ffmpeg.
+DOWNLOAD_SEM = asyncio.Semaphore(int(os.getenv("MAX_PARALLEL_DOWNLOADS", "2")))
+FFMPEG_SEM = asyncio.Semaphore(int(os.getenv("MAX_PARALLEL_FFMPEG", str(os.cpu_count() or 1))))
 DUB_SEM = threading.Semaphore(1)
+# Dubs run one at a time on a single long-lived thread (models stay loaded between dubs) instead
+# of a new thread per request parked on DUB_SEM. WORKER_MODE=subprocess runs dubs in a pool of
+# CLIPLINGUA_WORKERS persistent spawned processes instead (isolation from the API process); each
+# imports this module and loads its models once, then serves dub after dub.
+DUB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dub")
+WORKER_MODE = (os.getenv("WORKER_MODE") or "inprocess").strip().lower()
+CLIPLINGUA_WORKERS = max(1, min(os.cpu_count() or 1, int(os.getenv("CLIPLINGUA_WORKERS", "1"))))
+# Optionally pin each job ffmpeg to one core of our allowed set, round-robin, so concurrent
+# transcodes keep their own caches instead of being migrated between cores.
+ENABLE_CPU_PINNING = (os.getenv("ENABLE_CPU_PINNING") or "").strip().lower() in {"1", "true", "yes"}
+_PIN_CPUS: List[int] = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+_PIN_NEXT = itertools.count()
 
 # -----------------------------------------------------------------------------
 # Config
@@ -84,11 +126,60 @@ ARTIFACT_BUCKET = (os.getenv("ARTIFACT_BUCKET", "artifacts") or "artifacts").str
 SUPPORTED_DUB_LANGS = {"hi", "en", "es"}
 
 WHISPER_MODEL = (os.getenv("WHISPER_MODEL") or "tiny").strip()
+WHISPER_COMPUTE_TYPE = (os.getenv("WHISPER_COMPUTE_TYPE") or "int8").strip()
+# cpu | cuda | auto (CTranslate2 picks CUDA when a GPU is visible). Pair cuda with
+# WHISPER_COMPUTE_TYPE=int8_float16 or float16.
+WHISPER_DEVICE = (os.getenv("WHISPER_DEVICE") or "cpu").strip().lower()
+WHISPER_THREADS = int(os.getenv("WHISPER_THREADS", str(os.cpu_count() or 4)))
+WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+WHISPER_VAD = (os.getenv("WHISPER_VAD") or "1").strip().lower() in {"1", "true", "yes"}
+# Source-language hint (e.g. "en"); skips Whisper's language-detection pass when set.
+WHISPER_LANGUAGE = (os.getenv("WHISPER_LANGUAGE") or "").strip().lower() or None
 NLLB_MODEL = (os.getenv("NLLB_MODEL") or "facebook/nllb-200-distilled-300M").strip()
+# Optional CTranslate2 export of NLLB_MODEL, built at deploy time with:
+#   ct2-transformers-converter --model <NLLB_MODEL> --quantization int8 --output_dir <dir>
+NLLB_CT2_DIR = (os.getenv("NLLB_CT2_DIR") or "").strip()
+NLLB_BATCH_SIZE = int(os.getenv("NLLB_BATCH_SIZE", "16"))
+# Greedy by default; raise for quality A/B runs.
+NLLB_BEAMS = max(1, int(os.getenv("NLLB_BEAMS", "1")))
+# Dynamic int8 quantization of the transformers NLLB path: auto (only on CPUs with int8 dot-product
+# instructions, where it is actually faster) | 1 | 0
+NLLB_QUANTIZE = (os.getenv("NLLB_QUANTIZE") or "auto").strip().lower()
+# bf16 autocast for the unquantized transformers NLLB path: auto (AVX512-BF16/AMX hosts only) | 1 | 0
+NLLB_BF16 = (os.getenv("NLLB_BF16") or "auto").strip().lower()
+# Dub worker processes that may run models at once (the spawn pool inherits this environment).
+_MODEL_PROCS = CLIPLINGUA_WORKERS if WORKER_MODE == "subprocess" else 1
+# Intra-op threads for torch, per process: the cores are split across the dub workers so they do not
+# oversubscribe. Inter-op is pinned to 1 (generate() has no independent ops to overlap).
+TORCH_THREADS = int(os.getenv("TORCH_THREADS", str(max(1, (os.cpu_count() or 4) // _MODEL_PROCS))))
+# Must be in the environment before torch/ctranslate2 initialise their OpenMP runtime (both import lazily).
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_THREADS))
+# Compact pinning only pays off for a single model process: several processes would all pin to the
+# same first cores. Opt in with KMP_AFFINITY for other layouts.
+if _MODEL_PROCS == 1:
+    os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
 DISABLE_XTTS = (os.getenv("DISABLE_XTTS") or "").strip().lower() in {"1", "true", "yes"}
+# Models are loaded lazily on first use; list any to preload in the background at startup (whisper,nllb,piper).
+WARMUP_MODELS = {m.strip().lower() for m in (os.getenv("WARMUP_MODELS") or "").split(",") if m.strip()}
 
 DUB_STALE_SECONDS = int(os.getenv("DUB_STALE_SECONDS", "600"))
 
+# Reuse artifacts of an earlier finished job for the same URL (hardlinks, no re-download)
+ENABLE_URL_CACHE = (os.getenv("ENABLE_URL_CACHE") or "1").strip().lower() in {"1", "true", "yes"}
+
+# Download video/audio streams unmerged and let one ffmpeg pass write both video.mp4 and audio.wav,
+# instead of yt-dlp merging to an mp4 that ffmpeg then reads back for the audio. On by default:
+# YouTube always offers split formats; other sites without them fall back to the merged download,
+# at the cost of a second extractor run (set 0 for such workloads).
+YTDLP_SPLIT_STREAMS = (os.getenv("YTDLP_SPLIT_STREAMS") or "1").strip().lower() in {"1", "true", "yes"}
+# Kernel buffer for producer | consumer pipes (Linux default is 64 KiB).
+PIPE_BUFFER_BYTES = int(os.getenv("PIPE_BUFFER_BYTES", str(1024 * 1024)))
+
+# Download parallelism: fragments in flight for the native downloader, and the
+# aria2c connection settings used instead whenever aria2c is installed.
+YTDLP_CONCURRENT_FRAGMENTS = int(os.getenv("YTDLP_CONCURRENT_FRAGMENTS", "8"))
+YTDLP_ARIA2C_ARGS = (os.getenv("YTDLP_ARIA2C_ARGS") or "-x16 -s16 -k1M --file-allocation=none").strip()
+
 # Quality toggles
 ENABLE_AUDIO_NORMALIZATION = (os.getenv("ENABLE_AUDIO_NORMALIZATION") or "1").strip().lower() in {"1", "true", "yes"}
 ENABLE_SENTENCE_SPLITTING = (os.getenv("ENABLE_SENTENCE_SPLITTING") or "1").strip().lower() in {"1", "true", "yes"}
@@ -105,15 +196,129 @@ SEGMENT_FIT_TOLERANCE = float(os.getenv("SEGMENT_FIT_TOLERANCE", "1.06"))  # 6%
 EDGE_TTS_VOLUME = (os.getenv("EDGE_TTS_VOLUME") or "+0%").strip()
 EDGE_TTS_PITCH = (os.getenv("EDGE_TTS_PITCH") or "+0Hz").strip()
 
+# Piper (local ONNX VITS) voices, used when TTS_PROVIDER=piper. Override per language with PIPER_VOICE_<LANG>
+# (a voice name under PIPER_VOICES_DIR or a full path to its .onnx file).
+PIPER_VOICES_DIR = Path(os.getenv("PIPER_VOICES_DIR", "/models/piper"))
+PIPER_VOICES = {"en": "en_US-amy-medium", "hi": "hi_IN-pratham-medium", "es": "es_ES-davefx-medium"}
+
 BUILD_TAG = (os.getenv("BUILD_TAG") or "").strip() or None
 
+ARTIFACT_CHUNK_SIZE = int(os.getenv("ARTIFACT_CHUNK_SIZE", str(1024 * 1024)))
+# Behind nginx: internal location that aliases DATA_DIR (e.g. "/_artifacts" with
+# `location /_artifacts/ { internal; alias <DATA_DIR>/; }`). Media bodies are then sent by
+# nginx via sendfile(2) and never pass through Python.
+XACCEL_PREFIX = (os.getenv("CLIPLINGUA_XACCEL_PREFIX") or "").strip().rstrip("/")
+
+# Sync routes run in anyio's threadpool (default 40 threads); polling clients share it.
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "100"))
+
 # -------------  auto-clipper -------------
 ENABLE_AUTO_CLIPPER = (os.getenv("ENABLE_AUTO_CLIPPER", "1").lower() in {"1", "true", "yes"})
 CLIP_MAX_SEC = int(os.getenv("CLIP_MAX_SEC", "60"))      # hard ceiling
 CLIP_MIN_SEC = int(os.getenv("CLIP_MIN_SEC", "15"))      # discard if shorter
 CLIPS_BUCKET = os.getenv("CLIPS_BUCKET", "clips-out").strip()
 
-app = FastAPI(title="ClipLingua Worker", version="0.9.1-timed-dub")
+app = FastAPI(
+    title="ClipLingua Worker",
+    version="0.9.1-timed-dub",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+
+
+@app.on_event("startup")
+async def _tune_threadpool() -> None:
+    import anyio.to_thread
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+async def _start_job_flusher() -> None:
+    async def _loop() -> None:
+        while True:
+            await asyncio.sleep(JOB_FLUSH_INTERVAL)
+            await asyncio.to_thread(flush_jobs)
+
+    app.state.job_flusher = asyncio.create_task(_loop())
+
+
+async def _job_worker() -> None:
+    while True:
+        job_id, url, audio_only = await JOB_QUEUE.get()
+        try:
+            await process_job(job_id, url, audio_only)
+        except Exception as e:
+            print(f"WARNING: job worker failed job={job_id}: {e}")
+        finally:
+            JOB_QUEUE.task_done()
+
+
+@app.on_event("startup")
+async def _start_job_workers() -> None:
+    app.state.job_workers = [asyncio.create_task(_job_worker()) for _ in range(max(1, MAX_PARALLEL_JOBS))]
+
+
+@app.on_event("startup")
+async def _check_required_bins() -> None:
+    missing = [b for b in REQUIRED_BINS if not which_cached(b)]
+    if missing:
+        print(f"ERROR: required binaries not found: {', '.join(missing)}; jobs and dubs will fail")
+
+
+@app.on_event("startup")
+async def _probe_yt_dlp() -> None:
+    # Warm the --help cache so jobs never pay for the probe.
+    yt_dlp_bin = which_cached("yt-dlp")
+    if yt_dlp_bin:
+        await asyncio.to_thread(yt_dlp_supported_flags, yt_dlp_bin)
+
+
+@app.on_event("startup")
+async def _warmup_models() -> None:
+    # Background task: loading can take a while and must not hold up /health.
+    if WARMUP_MODELS:
+        app.state.model_warmup = asyncio.create_task(asyncio.to_thread(warmup_models))
+
+
+@app.on_event("shutdown")
+async def _stop_job_workers() -> None:
+    # Runs before the final flush: running jobs are marked error (and their children killed)
+    # by process_job's cancel handling; queued ones are marked here, so none is left hanging.
+    for task in app.state.job_workers:
+        task.cancel()
+    await asyncio.gather(*app.state.job_workers, return_exceptions=True)
+    while not JOB_QUEUE.empty():
+        job_id, _, _ = JOB_QUEUE.get_nowait()
+        update_job(job_id, {"status": "error", "error": "not started: worker shut down", **updated_stamp()})
+
+
+@app.on_event("startup")
+async def _start_dub_pool() -> None:
+    if WORKER_MODE == "subprocess":
+        import multiprocessing
+
+        app.state.dub_pool = ProcessPoolExecutor(
+            max_workers=CLIPLINGUA_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Spawn the children and import app.main in them now, not on the first dub request.
+        for _ in range(CLIPLINGUA_WORKERS):
+            app.state.dub_pool.submit(_dub_pool_ready)
+
+
+@app.on_event("shutdown")
+async def _stop_dub_executor() -> None:
+    # Drop dubs that have not started; a running one finishes (or is killed with the process).
+    # Dropped dubs stay "queued" and are reported stale after DUB_STALE_SECONDS.
+    DUB_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    if getattr(app.state, "dub_pool", None) is not None:
+        app.state.dub_pool.shutdown(wait=False, cancel_futures=True)
+
+
+@app.on_event("shutdown")
+async def _stop_job_flusher() -> None:
+    app.state.job_flusher.cancel()
+    await asyncio.to_thread(flush_jobs)
+
 
 # -----------------------------------------------------------------------------
 # Helpers
@@ -146,8 +351,7 @@ def supabase_uid_from_jwt(jwt_token: str) -> str:
     )
     try:
         with urllib.request.urlopen(req, timeout=20) as resp:
-            body = resp.read().decode("utf-8", errors="ignore")
-        data = json.loads(body)
+            data = json_loads(resp.read())
         uid = str(data.get("id") or "").strip()
         if not uid:
             raise HTTPException(status_code=401, detail="Invalid session")
@@ -187,12 +391,7 @@ def sb_upload_clip(job_id: str, idx: int, local_path: Path) -> Optional[str]:
         return None
     key = f"{job_id}/clip_{idx:03d}.mp4"
     try:
-        with open(local_path, "rb") as f:
-            _supabase.storage.from_(CLIPS_BUCKET).upload(
-                path=key,
-                file=f,
-                file_options={"cache-control": "31536000", "content-type": "video/mp4", "upsert": "true"},
-            )
+        sb_storage_upload(CLIPS_BUCKET, key, local_path, "video/mp4", "31536000")
         return key
     except Exception as e:
         print(f"WARNING: clip upload failed: {e}")
@@ -226,8 +425,7 @@ def refresh_google_access_token(refresh_token: str) -> str:
 
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:
-            body = resp.read().decode("utf-8", errors="ignore")
-        out = json.loads(body)
+            out = json_loads(resp.read())
         token = (out.get("access_token") or "").strip()
         if not token:
             raise RuntimeError(f"No access_token in response: {out}")
@@ -245,9 +443,10 @@ def sb_set_dub_youtube(job_id: str, lang: str, youtube_id: str, youtube_url: str
     try:
         current = sb_get_dub_status_map(job_id)
         prev = _as_dict(current.get(lang))
-        prev.update({"youtube_id": youtube_id, "youtube_url": youtube_url, "updated_at": now_iso()})
+        stamp = now_iso()
+        prev.update({"youtube_id": youtube_id, "youtube_url": youtube_url, "updated_at": stamp})
         current[lang] = prev
-        _supabase.table("clip_jobs").update({"dub_status": current, "updated_at": now_iso()}).eq("id", job_id).execute()
+        _supabase.table("clip_jobs").update({"dub_status": current, "updated_at": stamp}).eq("id", job_id).execute()
     except Exception:
         pass
 
@@ -293,7 +492,7 @@ def youtube_resumable_upload_mp4(
     }
 
     # 1) Start resumable session
-    r1 = requests.post(init_url, params=params, headers=headers, json=meta, timeout=(30, 60))
+    r1 = _HTTP.post(init_url, params=params, headers=headers, json=meta, timeout=(30, 60))
     if not r1.ok:
         raise HTTPException(status_code=400, detail=f"YouTube init failed: {r1.status_code} {r1.text[:2000]}")
     upload_url = r1.headers.get("Location") or r1.headers.get("location")
@@ -308,7 +507,7 @@ def youtube_resumable_upload_mp4(
     }
 
     with open(mp4_path, "rb") as f:
-        r2 = requests.put(upload_url, headers=put_headers, data=f, timeout=(60, 60 * 60))
+        r2 = _HTTP.put(upload_url, headers=put_headers, data=f, timeout=(60, 60 * 60))
 
     if not r2.ok:
         raise HTTPException(status_code=400, detail=f"YouTube upload failed: {r2.status_code} {r2.text[:2000]}")
@@ -322,60 +521,248 @@ def youtube_resumable_upload_mp4(
     url = f"https://youtu.be/{vid}"
     return vid, url
 
+
+_UTC = timezone.utc
+# (epoch second, formatted) of the last stamp: progress loops stamp many updates per second.
+_ISO_LAST: Tuple[int, str] = (-1, "")
+
+
+def iso_from_ts(ts: float) -> str:
+    """UTC ISO-8601 at second precision (updated_at_ts carries the sub-second value)."""
+    global _ISO_LAST
+    sec = int(ts)
+    last = _ISO_LAST
+    if last[0] == sec:
+        return last[1]
+    out = datetime.fromtimestamp(sec, tz=_UTC).isoformat()
+    _ISO_LAST = (sec, out)
+    return out
+
+
 def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return iso_from_ts(time.time())
+
+
+def updated_stamp() -> Dict[str, Any]:
+    """updated_at (ISO) and updated_at_ts (epoch) from a single clock read."""
+    ts = time.time()
+    return {"updated_at": iso_from_ts(ts), "updated_at_ts": ts}
 
 
 def clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
-def run_cmd(cmd: List[str], cwd: Optional[Path] = None) -> Tuple[int, str]:
+# Callers only log or report the end of a child's output, so by default only its last
+# CMD_OUTPUT_TAIL_BYTES are decoded. Pass tail_bytes=None when the whole output is parsed.
+CMD_OUTPUT_TAIL_BYTES = int(os.getenv("CMD_OUTPUT_TAIL_BYTES", str(64 * 1024)))
+
+
+def decode_tail(out: bytes, tail_bytes: Optional[int]) -> str:
+    if tail_bytes is not None and len(out) > tail_bytes:
+        out = out[-tail_bytes:]
+    return out.decode("utf-8", errors="replace")
+
+
+def read_tail_bytes(path: Path, tail_bytes: Optional[int]) -> bytes:
+    with open(path, "rb") as f:
+        if tail_bytes is not None:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - tail_bytes))
+        return f.read()
+
+
+def run_cmd(cmd: List[str], cwd: Optional[Path] = None, tail_bytes: Optional[int] = CMD_OUTPUT_TAIL_BYTES) -> Tuple[int, str]:
     proc = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
     )
-    return proc.returncode, proc.stdout
+    return proc.returncode, decode_tail(proc.stdout, tail_bytes)
+
+
+def next_cpuset() -> Optional[List[int]]:
+    if not ENABLE_CPU_PINNING or len(_PIN_CPUS) < 2:
+        return None
+    return [_PIN_CPUS[next(_PIN_NEXT) % len(_PIN_CPUS)]]
+
+
+async def run_cmd_async(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    cpuset: Optional[List[int]] = None,
+    tail_bytes: Optional[int] = CMD_OUTPUT_TAIL_BYTES,
+    output_path: Optional[Path] = None,
+) -> Tuple[int, str]:
+    """
+    Run `cmd` and return (returncode, tail of stdout+stderr).
+    With `output_path` the child writes straight into that file (appending) and only the
+    tail is read back, so verbose output is never held in memory.
+    """
+    out_fh = open(output_path, "ab") if output_path is not None else None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd) if cwd else None,
+            stdout=out_fh if out_fh is not None else asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    finally:
+        if out_fh is not None:
+            # The child holds its own copy of the fd.
+            out_fh.close()
+    if cpuset:
+        # Set from the parent right after spawn: preexec_fn is not safe with threads around.
+        try:
+            os.sched_setaffinity(proc.pid, cpuset)
+        except OSError:
+            pass
+    try:
+        out, _ = await proc.communicate()
+    except asyncio.CancelledError:
+        # Never leave the child running past its job.
+        proc.kill()
+        await proc.wait()
+        raise
+    if output_path is not None:
+        out = read_tail_bytes(output_path, tail_bytes)
+    return proc.returncode, decode_tail(out, tail_bytes)
+
+
+async def run_piped_async(producer: List[str], consumer: List[str], cwd: Optional[Path] = None) -> Tuple[int, int, str, str]:
+    """
+    Run `producer | consumer` without a shell.
+    Returns (producer_rc, consumer_rc, producer_stderr, consumer_output).
+    """
+    read_fd, write_fd = os.pipe()
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        try:
+            # Fewer producer/consumer wakeups per MB; capped by /proc/sys/fs/pipe-max-size.
+            fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, PIPE_BUFFER_BYTES)
+        except OSError:
+            pass
+    try:
+        p1 = await asyncio.create_subprocess_exec(
+            *producer, cwd=str(cwd) if cwd else None, stdout=write_fd, stderr=asyncio.subprocess.PIPE
+        )
+        p2 = await asyncio.create_subprocess_exec(
+            *consumer,
+            cwd=str(cwd) if cwd else None,
+            stdin=read_fd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    finally:
+        # The children hold their own copies; closing ours lets the producer see EPIPE if the consumer exits early.
+        os.close(read_fd)
+        os.close(write_fd)
+    try:
+        (_, err1), (out2, _) = await asyncio.gather(p1.communicate(), p2.communicate())
+    except asyncio.CancelledError:
+        for p in (p1, p2):
+            if p.returncode is None:
+                p.kill()
+        await asyncio.gather(p1.wait(), p2.wait())
+        raise
+    return (
+        p1.returncode,
+        p2.returncode,
+        decode_tail(err1, CMD_OUTPUT_TAIL_BYTES),
+        decode_tail(out2, CMD_OUTPUT_TAIL_BYTES),
+    )
+
+
+_BIN_CACHE: Dict[str, Optional[str]] = {}
+
+
+def which_cached(name: str) -> Optional[str]:
+    # PATH and the installed tools do not change at runtime, so misses are cached as well:
+    # an absent optional tool (aria2c, espeak-ng) must not cost a PATH walk on every job.
+    try:
+        return _BIN_CACHE[name]
+    except KeyError:
+        p = _BIN_CACHE[name] = shutil.which(name)
+        return p
 
 
 def require_bin(name: str) -> str:
-    p = shutil.which(name)
+    p = which_cached(name)
     if not p:
         raise RuntimeError(f"missing dependency: {name} not found in PATH")
     return p
 
 
-def wait_for_file(path: Path, min_bytes: int, tries: int = 200, sleep_s: float = 0.25) -> bool:
-    for _ in range(tries):
-        try:
-            if path.exists() and path.is_file() and path.stat().st_size >= min_bytes:
-                return True
-        except FileNotFoundError:
-            pass
-        time.sleep(sleep_s)
-    return False
+# Explicit paths (FFMPEG_BIN, FFPROBE_BIN, YT_DLP_BIN) skip the PATH walk entirely.
+for _bin, _env in (("ffmpeg", "FFMPEG_BIN"), ("ffprobe", "FFPROBE_BIN"), ("yt-dlp", "YT_DLP_BIN")):
+    _override = (os.getenv(_env) or "").strip()
+    if _override:
+        _BIN_CACHE[_bin] = _override if os.access(_override, os.X_OK) else None
+
+for _bin in ("yt-dlp", "ffmpeg", "ffprobe", "espeak-ng", "node", "fc-list", "aria2c"):
+    which_cached(_bin)
+
+# Resolved once above; reported at startup rather than discovered by the first job.
+REQUIRED_BINS = ("ffmpeg", "ffprobe", "yt-dlp")
+
+
+def _file_ready(path: Path, min_bytes: int) -> bool:
+    # Called once after the producing child has exited (its output is complete by then), so there
+    # is nothing to wait or poll for: one stat() answers both "regular file?" and "big enough?".
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size >= min_bytes
 
 
 def list_dir(folder: Path) -> str:
+    # os.scandir: DirEntry carries the d_type from getdents, so no extra stat() per entry
+    # to tell files from dirs. Explicit stack instead of recursion; one sort at the end.
     try:
-        items: List[str] = []
-        for p in sorted(folder.rglob("*")):
-            rel = p.relative_to(folder)
-            if p.is_dir():
-                items.append(f"[DIR]  {rel}")
-            else:
-                try:
-                    items.append(f"[FILE] {rel} ({p.stat().st_size} bytes)")
-                except Exception:
-                    items.append(f"[FILE] {rel} (size?)")
-        return "\n".join(items) if items else "<empty>"
+        entries: List[Tuple[str, str]] = []
+        stack: List[Tuple[str, str]] = [(str(folder), "")]
+        while stack:
+            d, prefix = stack.pop()
+            with os.scandir(d) as it:
+                for entry in it:
+                    rel = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((rel, f"[DIR]  {rel}"))
+                        stack.append((entry.path, rel + "/"))
+                    else:
+                        try:
+                            entries.append((rel, f"[FILE] {rel} ({entry.stat(follow_symlinks=False).st_size} bytes)"))
+                        except Exception:
+                            entries.append((rel, f"[FILE] {rel} (size?)"))
+        entries.sort()
+        return "\n".join(line for _, line in entries) if entries else "<empty>"
     except Exception as e:
         return f"<could not list dir: {e}>"
 
 
+def largest_file(folder: Path, prefix: str, suffix: str) -> Optional[Path]:
+    # Single scandir pass (one stat per candidate, none for other entries) instead of glob + sort.
+    best: Optional[Tuple[int, str]] = None
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                if best is None or size > best[0]:
+                    best = (size, entry.path)
+    except OSError:
+        return None
+    return Path(best[1]) if best else None
+
+
 def ensure_writable_dir(p: Path, fallback: Path) -> Path:
     try:
         p.mkdir(parents=True, exist_ok=True)
@@ -391,18 +778,135 @@ def ensure_writable_dir(p: Path, fallback: Path) -> Path:
 DATA_DIR = ensure_writable_dir(DATA_DIR, Path("/tmp/cliplingua/data"))
 TMP_DIR = ensure_writable_dir(TMP_DIR, Path("/tmp/cliplingua/tmp"))
 JOB_STORE_DIR = ensure_writable_dir(DATA_DIR / "jobs", DATA_DIR / "jobs")
+URL_INDEX_DIR = ensure_writable_dir(DATA_DIR / "by-url", DATA_DIR / "by-url")
+
+# One append-only progress stream shared by every in-process job. O_APPEND makes each
+# os.write land whole at the end of the file, so concurrent jobs never interleave mid-line.
+RUNNER_LOG_PATH = TMP_DIR / "runner.log"
+RUNNER_LOG_SCAN_BYTES = int(os.getenv("RUNNER_LOG_SCAN_BYTES", str(4 * 1024 * 1024)))
+# Size cap: past it the log is renamed to runner.log.1 (replacing the previous one) and reopened.
+RUNNER_LOG_MAX_BYTES = int(os.getenv("RUNNER_LOG_MAX_BYTES", str(64 * 1024 * 1024)))
+RUNNER_LOG_OLD_PATH = RUNNER_LOG_PATH.with_name(RUNNER_LOG_PATH.name + ".1")
+# The size is checked after this many bytes written by this process, not on every write.
+_RUNNER_LOG_CHECK_BYTES = 1024 * 1024
+RUNNER_LOG_FD = os.open(RUNNER_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+_RUNNER_LOG_LOCK = threading.Lock()
+_runner_log_unchecked = 0
+
+
+def _maybe_rotate_runner_log() -> None:
+    """Rotate when over RUNNER_LOG_MAX_BYTES; also reopen if another process already rotated it."""
+    global RUNNER_LOG_FD
+    st_fd = os.fstat(RUNNER_LOG_FD)
+    try:
+        st_path: Optional[os.stat_result] = os.stat(RUNNER_LOG_PATH)
+    except FileNotFoundError:
+        st_path = None
+    same = st_path is not None and st_path.st_ino == st_fd.st_ino and st_path.st_dev == st_fd.st_dev
+    if same and st_fd.st_size < RUNNER_LOG_MAX_BYTES:
+        return
+    if same:
+        os.replace(RUNNER_LOG_PATH, RUNNER_LOG_OLD_PATH)
+    old_fd = RUNNER_LOG_FD
+    RUNNER_LOG_FD = os.open(RUNNER_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    os.close(old_fd)
+
+
+def runner_log_write(job_id: str, text: str) -> None:
+    global _runner_log_unchecked
+    prefix = f"[{job_id}] ".encode("utf-8")
+    lines = [prefix + line.encode("utf-8", "replace") + b"\n" for line in text.splitlines() if line]
+    if not lines:
+        return
+    try:
+        with _RUNNER_LOG_LOCK:
+            _runner_log_unchecked += os.write(RUNNER_LOG_FD, b"".join(lines))
+            if _runner_log_unchecked >= _RUNNER_LOG_CHECK_BYTES:
+                _runner_log_unchecked = 0
+                _maybe_rotate_runner_log()
+    except OSError as e:
+        print(f"WARNING: runner_log_write failed: {e}")
+
+
+def runner_log_tail(job_id: str) -> Optional[str]:
+    """Lines for job_id from the last RUNNER_LOG_SCAN_BYTES of the shared runner log."""
+    prefix = f"[{job_id}] ".encode("utf-8")
+    try:
+        with open(RUNNER_LOG_PATH, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - RUNNER_LOG_SCAN_BYTES))
+            chunk = f.read()
+    except OSError:
+        return None
+    if len(chunk) < RUNNER_LOG_SCAN_BYTES:
+        # Just rotated: the rest of the scan window is the tail of runner.log.1.
+        try:
+            with open(RUNNER_LOG_OLD_PATH, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                f.seek(max(0, size - (RUNNER_LOG_SCAN_BYTES - len(chunk))))
+                chunk = f.read() + chunk
+        except OSError:
+            pass
+    lines = [line[len(prefix):] for line in chunk.splitlines() if line.startswith(prefix)]
+    if not lines:
+        return None
+    return b"\n".join(lines).decode("utf-8", "replace") + "\n"
 
 
-def atomic_write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+# Dev/ephemeral disks: skip the fsync even for durable=True writes.
+FAST_WRITE = (os.getenv("CLIPLINGUA_FAST_WRITE") or "").strip().lower() in {"1", "true", "yes"}
+
+
+def atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """Write via a sibling .tmp and os.replace. durable=True fsyncs before the rename (unless FAST_WRITE)."""
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(text, encoding="utf-8")
-    tmp.replace(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(tmp, flags, 0o666)
+    except FileNotFoundError:
+        # Only create the parent on a miss instead of a mkdir() syscall on every write.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable and not FAST_WRITE:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available). Use `python -m json.tool` to read."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def safe_move(src: Path, dst: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(src), str(dst))
+    try:
+        # Same filesystem: atomic rename, no bytes copied.
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    # Cross-device (e.g. TMP_DIR on tmpfs): shutil.copyfile uses sendfile(2) on Linux,
+    # so data never passes through user-space buffers. Copy to a sibling then rename
+    # so readers never see a partially written artifact.
+    tmp = dst.with_suffix(dst.suffix + ".tmp")
+    shutil.copyfile(src, tmp)
+    tmp.replace(dst)
+    src.unlink(missing_ok=True)
 
 
 # -----------------------------------------------------------------------------
@@ -415,6 +919,10 @@ if SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY:
         from supabase import create_client
 
         _supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        # The REST and storage sub-clients are built lazily, each around one pooled keep-alive
+        # httpx.Client. Build them now so concurrent first requests cannot race to create extras.
+        _supabase.postgrest
+        _supabase.storage
     except Exception as e:
         print(f"WARNING: Supabase client creation failed: {e}")
         _supabase = None
@@ -428,9 +936,23 @@ def storage_key(job_id: str, filename: str) -> str:
     return f"jobs/{job_id}/{filename}"
 
 
+# Cleared when the append_job_log RPC (supabase/migrations/*_append_job_log.sql) is not deployed.
+_SB_APPEND_LOG_RPC = True
+
+
 def sb_append_log(job_id: str, text: str) -> None:
+    global _SB_APPEND_LOG_RPC
     if not _supabase:
         return
+    if _SB_APPEND_LOG_RPC:
+        try:
+            _supabase.rpc("append_job_log", {"jid": job_id, "t": text, "max_chars": MAX_LOG_CHARS}).execute()
+            return
+        except Exception as e:
+            # PGRST202: function not found in the schema cache; anything else is retried next call.
+            if "PGRST202" in str(e):
+                _SB_APPEND_LOG_RPC = False
+            print(f"WARNING: append_job_log rpc failed, using select+update: {e}")
     try:
         res = _supabase.table("clip_jobs").select("log_text").eq("id", job_id).limit(1).execute()
         data = getattr(res, "data", None) or []
@@ -444,6 +966,39 @@ def sb_append_log(job_id: str, text: str) -> None:
         print(f"WARNING: sb_append_log failed: {e}")
 
 
+def _storage_object_url(bucket: str, key: str) -> str:
+    return f"{SUPABASE_URL.rstrip('/')}/storage/v1/object/{bucket}/{urllib.parse.quote(key)}"
+
+
+def _storage_headers() -> Dict[str, str]:
+    return {"Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}", "apikey": SUPABASE_SERVICE_ROLE_KEY}
+
+
+def sb_storage_upload(bucket: str, key: str, local_path: Path, content_type: str, cache_control: str) -> None:
+    """
+    Upload via the Storage REST API, streaming the file from disk (the supabase-py client
+    reads the whole file into memory first). Falls back to the client without `requests`.
+    """
+    if requests is None:
+        with open(local_path, "rb") as f:
+            _supabase.storage.from_(bucket).upload(
+                path=key,
+                file=f,
+                file_options={"cache-control": cache_control, "content-type": content_type, "upsert": "true"},
+            )
+        return
+    headers = {
+        **_storage_headers(),
+        "Content-Type": content_type,
+        "cache-control": f"max-age={cache_control}",
+        "x-upsert": "true",
+    }
+    with open(local_path, "rb") as f:
+        r = _HTTP.post(_storage_object_url(bucket, key), headers=headers, data=f, timeout=(30, 60 * 60))
+    if r.status_code >= 300:
+        raise RuntimeError(f"storage upload failed status={r.status_code} body={r.text[:500]}")
+
+
 def sb_upload_file(job_id: str, local_path: Path, filename: str, content_type: str) -> Optional[str]:
     if not _supabase:
         return None
@@ -451,12 +1006,7 @@ def sb_upload_file(job_id: str, local_path: Path, filename: str, content_type: s
     try:
         if not local_path.exists() or local_path.stat().st_size == 0:
             raise RuntimeError(f"missing/empty file: {local_path}")
-        with open(local_path, "rb") as f:
-            _supabase.storage.from_(ARTIFACT_BUCKET).upload(
-                path=key,
-                file=f,
-                file_options={"cache-control": "3600", "content-type": content_type, "upsert": "true"},
-            )
+        sb_storage_upload(ARTIFACT_BUCKET, key, local_path, content_type, "3600")
         return key
     except Exception as e:
         try:
@@ -466,16 +1016,109 @@ def sb_upload_file(job_id: str, local_path: Path, filename: str, content_type: s
         return None
 
 
+def sb_upload_files(job_id: str, items: List[Tuple[Path, str, str]]) -> List[Optional[str]]:
+    """Upload independent (local_path, filename, content_type) artifacts concurrently; keys in input order."""
+    if not _supabase or not items:
+        return [None] * len(items)
+    with ThreadPoolExecutor(max_workers=len(items)) as ex:
+        futures = [ex.submit(sb_upload_file, job_id, p, name, ct) for p, name, ct in items]
+        return [f.result() for f in futures]
+
+
 def sb_download_key(key: str, dest_path: Path) -> bool:
     if not _supabase or not key:
         return False
+    tmp: Optional[str] = None
     try:
-        data = _supabase.storage.from_(ARTIFACT_BUCKET).download(key)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_bytes(data)
-        return dest_path.exists() and dest_path.stat().st_size > 0
+        # Unique sibling temp file: a failed download never leaves a truncated artifact, and two
+        # concurrent downloads of the same destination never write into the same inode.
+        fd, tmp = tempfile.mkstemp(dir=dest_path.parent, prefix=dest_path.name + ".", suffix=".part")
+        with os.fdopen(fd, "wb") as f:
+            if requests is None:
+                f.write(_supabase.storage.from_(ARTIFACT_BUCKET).download(key))
+            else:
+                with _HTTP.get(
+                    _storage_object_url(ARTIFACT_BUCKET, key), headers=_storage_headers(), stream=True, timeout=(30, 300)
+                ) as r:
+                    r.raise_for_status()
+                    for chunk in r.iter_content(chunk_size=ARTIFACT_CHUNK_SIZE):
+                        f.write(chunk)
+        os.replace(tmp, dest_path)
+        tmp = None
+        return _file_ready(dest_path, 1)
     except Exception:
         return False
+    finally:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+# Shared local copies of downloaded storage objects. Object keys are write-once per job and
+# url-cache hits reuse the source job's keys, so a key names one immutable blob.
+BLOB_CACHE_DIR = DATA_DIR / "_blobs"
+# Least recently used blobs are deleted past this total. Job copies are hardlinks or real copies,
+# so evicting a blob never breaks an artifact.
+BLOB_CACHE_MAX_BYTES = int(os.getenv("BLOB_CACHE_MAX_BYTES", str(20 * 1024 * 1024 * 1024)))
+
+
+def _evict_blobs() -> None:
+    blobs: List[Tuple[float, int, str]] = []
+    try:
+        with os.scandir(BLOB_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".part"):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                blobs.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in blobs)
+    for _, size, path in sorted(blobs):
+        if total <= BLOB_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def sb_download_key_cached(key: str, dest_path: Path) -> bool:
+    """sb_download_key through BLOB_CACHE_DIR: a blob already fetched by any job is linked, not re-downloaded."""
+    if not key:
+        return False
+    blob = BLOB_CACHE_DIR / hashlib.sha256(key.encode("utf-8")).hexdigest()
+    fetched = False
+    if _file_ready(blob, 1):
+        try:
+            os.utime(blob)  # mtime is the LRU clock for _evict_blobs
+        except OSError:
+            pass
+    elif sb_download_key(key, blob):
+        fetched = True
+    else:
+        return False
+    try:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        dest_path.unlink(missing_ok=True)
+        try:
+            os.link(blob, dest_path)
+        except OSError:
+            # No hardlinks here: copy, so the artifact does not depend on the blob surviving eviction.
+            shutil.copyfile(blob, dest_path)
+    except OSError:
+        return sb_download_key(key, dest_path)
+    if fetched:
+        # After linking, so the blob just fetched is never evicted before this job has its copy.
+        _evict_blobs()
+    return True
 
 
 def sb_download_file(job_id: str, filename: str, dest_path: Path) -> bool:
@@ -489,7 +1132,7 @@ def _as_dict(v: Any) -> Dict[str, Any]:
         return v
     if isinstance(v, str):
         try:
-            parsed = json.loads(v)
+            parsed = json_loads(v)
             return parsed if isinstance(parsed, dict) else {}
         except Exception:
             return {}
@@ -509,29 +1152,49 @@ def sb_get_job(job_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _sb_job_row(job_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    row = {
+        "id": job_id,
+        "url": payload.get("url"),
+        "status": payload.get("status", "queued"),
+        "error": payload.get("error"),
+        # Mirror the stamp update_job already put in the payload instead of formatting a new one.
+        "updated_at": payload.get("updated_at") or now_iso(),
+        "video_url": payload.get("video_url"),
+        "audio_url": payload.get("audio_url"),
+        "log_url": payload.get("log_url"),
+        "storage_video_key": payload.get("storage_video_key"),
+        "storage_audio_key": payload.get("storage_audio_key"),
+        "storage_log_key": payload.get("storage_log_key"),
+        "dub_status": payload.get("dub_status"),
+        "dub_log_text": payload.get("dub_log_text"),
+    }
+    return {k: v for k, v in row.items() if v is not None}
+
+
+def sb_upsert_jobs(items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Upsert many jobs with one request per distinct column set (a bulk upsert NULLs absent columns).
+    Returns the ids whose upsert failed.
+    """
+    if not _supabase or not items:
+        return []
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for job_id, payload in items:
+        row = _sb_job_row(job_id, payload)
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    failed: List[str] = []
+    for rows in groups.values():
+        try:
+            _supabase.table("clip_jobs").upsert(rows).execute()
+        except Exception as e:
+            print(f"WARNING: sb_upsert_jobs failed for {len(rows)} rows: {e}")
+            failed.extend(row["id"] for row in rows)
+    return failed
+
+
 def sb_upsert_job(job_id: str, payload: Dict[str, Any]) -> None:
-    if not _supabase:
-        return
-    try:
-        row = {
-            "id": job_id,
-            "url": payload.get("url"),
-            "status": payload.get("status", "queued"),
-            "error": payload.get("error"),
-            "updated_at": now_iso(),
-            "video_url": payload.get("video_url"),
-            "audio_url": payload.get("audio_url"),
-            "log_url": payload.get("log_url"),
-            "storage_video_key": payload.get("storage_video_key"),
-            "storage_audio_key": payload.get("storage_audio_key"),
-            "storage_log_key": payload.get("storage_log_key"),
-            "dub_status": payload.get("dub_status"),
-            "dub_log_text": payload.get("dub_log_text"),
-        }
-        row = {k: v for k, v in row.items() if v is not None}
-        _supabase.table("clip_jobs").upsert(row).execute()
-    except Exception as e:
-        print(f"WARNING: sb_upsert_job failed: {e}")
+    sb_upsert_jobs([(job_id, payload)])
 
 
 def sb_get_log(job_id: str) -> Optional[str]:
@@ -578,7 +1241,8 @@ def sb_upsert_dub_status(
     try:
         current = sb_get_dub_status_map(job_id)
         prev = _as_dict(current.get(lang))
-        prev.update({"status": status, "error": error, "updated_at": now_iso()})
+        stamp = now_iso()
+        prev.update({"status": status, "error": error, "updated_at": stamp})
         if audio_key:
             prev["audio_key"] = audio_key
         if video_key:
@@ -588,7 +1252,7 @@ def sb_upsert_dub_status(
         if srt_key:
             prev["srt_key"] = srt_key
         current[lang] = prev
-        _supabase.table("clip_jobs").update({"dub_status": current, "updated_at": now_iso()}).eq("id", job_id).execute()
+        _supabase.table("clip_jobs").update({"dub_status": current, "updated_at": stamp}).eq("id", job_id).execute()
     except Exception as e:
         print(f"WARNING: sb_upsert_dub_status failed: {e}")
 
@@ -637,27 +1301,155 @@ def job_json_path(job_id: str) -> Path:
     return job_dir(job_id) / "job.json"
 
 
-def save_job_local(job_id: str, payload: Dict[str, Any]) -> None:
-    atomic_write_text(job_json_path(job_id), json.dumps(payload, indent=2))
+def job_status_path(job_id: str) -> Path:
+    return job_dir(job_id) / "status"
+
 
+# Job payloads persist in one SQLite file (WAL: readers never block the flusher,
+# synchronous=NORMAL: no fsync per commit). Connections are per thread.
+JOBS_DB_PATH = DATA_DIR / "jobs.db"
+_JOBS_DB_LOCAL = threading.local()
 
-def _artifact_urls(job_id: str) -> Dict[str, Optional[str]]:
+
+def _open_jobs_db(**kwargs: Any) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(JOBS_DB_PATH), timeout=30, **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, payload BLOB NOT NULL, updated_at_ts REAL)"
+    )
+    return conn
+
+
+def _jobs_db() -> sqlite3.Connection:
+    conn = getattr(_JOBS_DB_LOCAL, "conn", None)
+    if conn is None:
+        conn = _JOBS_DB_LOCAL.conn = _open_jobs_db()
+    return conn
+
+
+# One connection for this process's flushes *and* its data_version checks: data_version does not
+# change for a connection's own commits, so only writes by other processes (runners) register.
+_JOBS_DB_WRITER: Optional[sqlite3.Connection] = None
+_JOBS_DB_WRITER_LOCK = threading.Lock()
+_JOBS_DB_SEEN_VERSION: Optional[int] = None
+
+
+def _jobs_db_writer() -> sqlite3.Connection:
+    global _JOBS_DB_WRITER
+    if _JOBS_DB_WRITER is None:
+        _JOBS_DB_WRITER = _open_jobs_db(check_same_thread=False)
+    return _JOBS_DB_WRITER
+
+
+# In-memory registry is the source of truth for local job state; a background task
+# flushes dirty entries to jobs.db. Entries are snapshots and never mutated in place.
+JOB_FLUSH_INTERVAL = float(os.getenv("JOB_FLUSH_INTERVAL", "0.5"))
+JOB_CACHE_MAX = int(os.getenv("JOB_CACHE_MAX", "2000"))
+
+_JOBS: Dict[str, Dict[str, Any]] = {}
+_JOBS_DIRTY: Set[str] = set()
+# Jobs whose Supabase row lags the registry; upserted (coalesced, batched) by flush_jobs.
+_SB_DIRTY: Set[str] = set()
+_JOBS_LOCK = threading.Lock()
+
+
+def save_job_local(job_id: str, payload: Dict[str, Any]) -> None:
+    snapshot = dict(payload)
+    with _JOBS_LOCK:
+        prev = _JOBS.pop(job_id, None)
+        _JOBS[job_id] = snapshot
+        _JOBS_DIRTY.add(job_id)
+    # Companion one-line status file so status polls skip the JSON parse.
+    # Written through immediately (and only on change) so /status never lags the flusher.
+    status = snapshot.get("status")
+    if status and (prev is None or prev.get("status") != status):
+        atomic_write_bytes(job_status_path(job_id), f"{status}\n".encode("utf-8"))
+
+
+def flush_jobs() -> None:
+    with _JOBS_LOCK:
+        dirty = [(job_id, _JOBS[job_id]) for job_id in _JOBS_DIRTY if job_id in _JOBS]
+        _JOBS_DIRTY.clear()
+        sb_dirty = [(job_id, _JOBS[job_id]) for job_id in _SB_DIRTY if job_id in _JOBS]
+        _SB_DIRTY.clear()
+    if dirty:
+        rows = [(job_id, json_dumps_bytes(payload), payload.get("updated_at_ts")) for job_id, payload in dirty]
+        try:
+            with _JOBS_DB_WRITER_LOCK:
+                conn = _jobs_db_writer()
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO jobs (id, payload, updated_at_ts) VALUES (?, ?, ?)", rows)
+        except Exception as e:
+            print(f"WARNING: flush of {len(rows)} jobs failed: {e}")
+            with _JOBS_LOCK:
+                _JOBS_DIRTY.update(job_id for job_id, _ in dirty)
+    sb_failed = sb_upsert_jobs(sb_dirty)
+    if sb_failed:
+        # Retried on the next flush; entries still dirty for Supabase are never evicted below.
+        with _JOBS_LOCK:
+            _SB_DIRTY.update(sb_failed)
+    with _JOBS_LOCK:
+        # Evict least recently saved clean entries.
+        for job_id in list(_JOBS):
+            if len(_JOBS) <= JOB_CACHE_MAX:
+                break
+            if job_id not in _JOBS_DIRTY and job_id not in _SB_DIRTY:
+                del _JOBS[job_id]
+
+
+def _artifact_urls(job_id: str, audio_only: bool = False) -> Dict[str, Optional[str]]:
+    """Public artifact URLs; fixed per job, so they are stored once when the job is created."""
     if not PUBLIC_BASE_URL:
         return {"video_url": None, "audio_url": None, "log_url": None}
     return {
-        "video_url": f"{PUBLIC_BASE_URL}/jobs/{job_id}/video",
+        "video_url": None if audio_only else f"{PUBLIC_BASE_URL}/jobs/{job_id}/video",
         "audio_url": f"{PUBLIC_BASE_URL}/jobs/{job_id}/audio",
         "log_url": f"{PUBLIC_BASE_URL}/jobs/{job_id}/log",
     }
 
 
+def _sync_registry_with_db() -> None:
+    """
+    Runner subprocesses (WORKER_MODE=subprocess) write jobs.db directly. PRAGMA data_version
+    changes when another connection has committed: only then drop the clean registry entries
+    so they are re-read, instead of re-reading every job on every request. Checked on the
+    connection flush_jobs writes through, so this process's own flushes do not count.
+    """
+    global _JOBS_DB_SEEN_VERSION
+    with _JOBS_DB_WRITER_LOCK:
+        v = _jobs_db_writer().execute("PRAGMA data_version").fetchone()[0]
+        seen = v if _JOBS_DB_SEEN_VERSION is None else _JOBS_DB_SEEN_VERSION
+        _JOBS_DB_SEEN_VERSION = v
+    if seen != v:
+        with _JOBS_LOCK:
+            for job_id in [j for j in _JOBS if j not in _JOBS_DIRTY and j not in _SB_DIRTY]:
+                del _JOBS[job_id]
+
+
 def load_job_local(job_id: str) -> Optional[Dict[str, Any]]:
+    if WORKER_MODE == "subprocess":
+        _sync_registry_with_db()
+    cached = _JOBS.get(job_id)
+    if cached is not None:
+        return dict(cached)
+    row = _jobs_db().execute("SELECT payload FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    if row is not None:
+        job = json_loads(row[0])
+        with _JOBS_LOCK:
+            _JOBS.setdefault(job_id, job)
+        return dict(job)
     p = job_json_path(job_id)
     if p.exists():
-        return json.loads(p.read_text(encoding="utf-8"))
+        # Pre-SQLite store: adopt it and let the flusher copy it into jobs.db.
+        job = json_loads(p.read_bytes())
+        with _JOBS_LOCK:
+            _JOBS.setdefault(job_id, job)
+            _JOBS_DIRTY.add(job_id)
+        return dict(job)
     legacy = DATA_DIR / f"{job_id}.json"
     if legacy.exists():
-        job = json.loads(legacy.read_text(encoding="utf-8"))
+        job = json_loads(legacy.read_bytes())
         jd = job_dir(job_id)
         jd.mkdir(parents=True, exist_ok=True)
         job.setdefault("id", job_id)
@@ -667,57 +1459,71 @@ def load_job_local(job_id: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+def _job_from_sb_row(sb: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(sb.get("id")),
+        "url": sb.get("url"),
+        "status": sb.get("status"),
+        "error": sb.get("error"),
+        "video_url": sb.get("video_url"),
+        "audio_url": sb.get("audio_url"),
+        "log_url": sb.get("log_url"),
+        "created_at": sb.get("created_at"),
+        "updated_at": sb.get("updated_at"),
+        "storage_video_key": sb.get("storage_video_key"),
+        "storage_audio_key": sb.get("storage_audio_key"),
+        "storage_log_key": sb.get("storage_log_key"),
+        "dub_status": sb.get("dub_status") or {},
+        "dub_log_text": sb.get("dub_log_text") or {},
+    }
+
+
 def load_job(job_id: str) -> Dict[str, Any]:
+    if job_id in _SB_DIRTY:
+        # Our copy is newer than the Supabase row until the next flush.
+        local = load_job_local(job_id)
+        if local:
+            return local
     sb = sb_get_job(job_id)
     if sb:
-        return {
-            "id": str(sb.get("id")),
-            "url": sb.get("url"),
-            "status": sb.get("status"),
-            "error": sb.get("error"),
-            "video_url": sb.get("video_url"),
-            "audio_url": sb.get("audio_url"),
-            "log_url": sb.get("log_url"),
-            "created_at": sb.get("created_at"),
-            "updated_at": sb.get("updated_at"),
-            "storage_video_key": sb.get("storage_video_key"),
-            "storage_audio_key": sb.get("storage_audio_key"),
-            "storage_log_key": sb.get("storage_log_key"),
-            "dub_status": sb.get("dub_status") or {},
-            "dub_log_text": sb.get("dub_log_text") or {},
-        }
+        return _job_from_sb_row(sb)
     local = load_job_local(job_id)
     if local:
         return local
     raise HTTPException(status_code=404, detail="job not found")
 
 
-def update_job(job_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+def load_finished_job(job_id: str) -> Dict[str, Any]:
+    """
+    Artifact fields of a finished job never change, so a job this worker has locally as
+    done is served from the in-memory registry instead of a Supabase read per request.
+    """
     local = load_job_local(job_id)
+    if local and local.get("status") == "done":
+        return local
+    return load_job(job_id)
+
+
+def update_job(job_id: str, patch: Dict[str, Any], job: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Apply `patch` and persist. Pass the dict returned by a previous update_job
+    as `job` to skip re-reading it from the job store.
+    """
+    local = job if job is not None else load_job_local(job_id)
     if not local:
         sb = sb_get_job(job_id)
         if sb:
-            local = {
-                "id": str(sb.get("id")),
-                "url": sb.get("url"),
-                "status": sb.get("status"),
-                "error": sb.get("error"),
-                "video_url": sb.get("video_url"),
-                "audio_url": sb.get("audio_url"),
-                "log_url": sb.get("log_url"),
-                "created_at": sb.get("created_at"),
-                "updated_at": sb.get("updated_at"),
-                "storage_video_key": sb.get("storage_video_key"),
-                "storage_audio_key": sb.get("storage_audio_key"),
-                "storage_log_key": sb.get("storage_log_key"),
-                "dub_status": sb.get("dub_status") or {},
-                "dub_log_text": sb.get("dub_log_text") or {},
-            }
+            local = _job_from_sb_row(sb)
         else:
             local = {"id": job_id}
+    elif all(k in local and local[k] == v for k, v in patch.items()):
+        return local  # no-op patch: nothing to write or upsert
     local.update(patch)
     save_job_local(job_id, local)
-    sb_upsert_job(job_id, local)
+    if _supabase:
+        # Off the critical path: flush_jobs upserts the latest snapshot, however many updates came in.
+        with _JOBS_LOCK:
+            _SB_DIRTY.add(job_id)
     return local
 
 
@@ -729,16 +1535,83 @@ def update_job(job_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
 def _get_whisper():
     from faster_whisper import WhisperModel
 
-    return WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+    return WhisperModel(
+        WHISPER_MODEL,
+        device=WHISPER_DEVICE,
+        compute_type=WHISPER_COMPUTE_TYPE,
+        cpu_threads=WHISPER_THREADS,
+        num_workers=1,
+    )
+
+
+@lru_cache(maxsize=1)
+def _cpu_flags() -> str:
+    try:
+        return Path("/proc/cpuinfo").read_text(errors="ignore")
+    except OSError:
+        return ""
+
+
+def _cpu_has_int8_dot() -> bool:
+    """AVX512-VNNI / AVX-VNNI on x86, dot-product extension on ARM."""
+    return any(f in _cpu_flags() for f in ("avx512_vnni", "avx_vnni", "asimddp"))
+
+
+def _cpu_has_bf16() -> bool:
+    return any(f in _cpu_flags() for f in ("avx512_bf16", "amx_bf16"))
 
 
 @lru_cache(maxsize=1)
 def _get_nllb():
+    """(tokenizer, model, bf16): bf16 says whether generate() should run under bf16 autocast."""
+    import torch
     from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
+    torch.set_num_threads(TORCH_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # only settable before the first parallel op; keep whatever is already in place
     tok = AutoTokenizer.from_pretrained(NLLB_MODEL)
     model = AutoModelForSeq2SeqLM.from_pretrained(NLLB_MODEL)
-    return tok, model
+    model.eval()
+
+    quantize = NLLB_QUANTIZE in {"1", "true", "yes"} or (NLLB_QUANTIZE == "auto" and _cpu_has_int8_dot())
+    if quantize and torch.backends.quantized.engine != "none":
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return tok, model, False
+    bf16 = NLLB_BF16 in {"1", "true", "yes"} or (NLLB_BF16 == "auto" and _cpu_has_bf16())
+    return tok, model, bf16
+
+
+@lru_cache(maxsize=1)
+def _get_nllb_ct2():
+    import ctranslate2
+    from transformers import AutoTokenizer
+
+    tok = AutoTokenizer.from_pretrained(NLLB_MODEL)
+    translator = ctranslate2.Translator(
+        NLLB_CT2_DIR, device="cpu", compute_type="int8", intra_threads=TORCH_THREADS
+    )
+    return tok, translator
+
+
+def warmup_models() -> None:
+    """Preload the models named in WARMUP_MODELS so the first job does not pay for loading them."""
+    loaders = {
+        "whisper": _get_whisper,
+        "nllb": _get_nllb_ct2 if NLLB_CT2_DIR else _get_nllb,
+        "piper": lambda: [_get_piper_voice(lang) for lang in PIPER_VOICES],
+    }
+    for name in sorted(WARMUP_MODELS):
+        fn = loaders.get(name)
+        if fn is None:
+            print(f"WARNING: unknown WARMUP_MODELS entry: {name}")
+            continue
+        try:
+            fn()
+        except Exception as e:
+            print(f"WARNING: warmup {name} failed: {e}")
 
 
 # -----------------------------------------------------------------------------
@@ -777,10 +1650,10 @@ def probe_video_size(video_in: Path) -> Tuple[int, int]:
 
 def _font_exists(font_name: str) -> bool:
     try:
-        fc = shutil.which("fc-list")
+        fc = which_cached("fc-list")
         if not fc:
             return False
-        rc, out = run_cmd([fc, ":family"], cwd=None)
+        rc, out = run_cmd([fc, ":family"], cwd=None, tail_bytes=None)
         if rc != 0:
             return False
         return font_name.lower() in out.lower()
@@ -891,8 +1764,7 @@ def write_srt(entries: List[Dict[str, Any]], out_path: Path) -> None:
         lines.append(f"{srt_ts(e['start'])} --> {srt_ts(e['end'])}")
         lines.append((e.get("text") or "").strip())
         lines.append("")
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines), encoding="utf-8", errors="ignore")
+    atomic_write_bytes(out_path, "\n".join(lines).encode("utf-8", errors="ignore"))
 
 
 def burn_captions(
@@ -938,7 +1810,7 @@ def burn_captions(
         log_fn(out)
         log_fn(f"caption_font={pick_caption_font(lang)} video_h={vh} style={caption_style}")
         log_fn(f"fontsdir={fontsdir}")
-    if rc != 0 or (not video_out.exists()) or video_out.stat().st_size < 10_000:
+    if rc != 0 or not _file_ready(video_out, 10_000):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"burn captions failed (rc={rc})\n{tail}")
 
@@ -976,7 +1848,7 @@ def make_silence_wav(duration_s: float, out_wav: Path) -> None:
         str(out_wav),
     ]
     rc, out = run_cmd(cmd, cwd=None)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-120:])
         raise RuntimeError(f"make_silence_wav failed (rc={rc})\n{tail}")
 
@@ -1036,7 +1908,7 @@ def stretch_or_pad_to_duration(in_wav: Path, out_wav: Path, target_sec: float, l
     rc, out = run_cmd(cmd, cwd=None)
     if log_fn:
         log_fn(out)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"segment fit failed (rc={rc})\n{tail}")
 
@@ -1060,7 +1932,7 @@ def ffmpeg_concat_wavs(inputs: List[Path], out_wav: Path, log_fn=None) -> None:
     rc, out = run_cmd(args, cwd=None)
     if log_fn:
         log_fn(out)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"concat failed (rc={rc})\n{tail}")
 
@@ -1099,13 +1971,21 @@ def normalize_audio(audio_path: Path, log_fn=None) -> None:
             log_fn(f"audio_normalized_error={e} (non-critical)")
 
 
-def mux_audio_into_video(video_in: Path, audio_in: Path, video_out: Path, log_fn=None) -> None:
+def mux_audio_into_video(video_in: Path, audio_in: Path, video_out: Path, log_fn=None, faststart: bool = False) -> None:
+    """
+    Swap in the dubbed audio track: video is stream-copied (never re-encoded), only audio is encoded.
+    `faststart` moves the moov atom to the front; only worth its extra rewrite pass when
+    `video_out` is the final, served file (not an input to burn_captions).
+    """
     ffmpeg = require_bin("ffmpeg")
     video_out.parent.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         ffmpeg,
+        "-nostdin",
         "-y",
+        "-fflags",
+        "+genpts",
         "-i",
         str(video_in),
         "-i",
@@ -1114,6 +1994,8 @@ def mux_audio_into_video(video_in: Path, audio_in: Path, video_out: Path, log_fn
         "0:v:0",
         "-map",
         "1:a:0",
+        "-sn",
+        "-dn",
         "-c:v",
         "copy",
         "-c:a",
@@ -1121,8 +2003,10 @@ def mux_audio_into_video(video_in: Path, audio_in: Path, video_out: Path, log_fn
         "-b:a",
         "160k",
         "-shortest",
-        str(video_out),
     ]
+    if faststart:
+        cmd += ["-movflags", "+faststart"]
+    cmd.append(str(video_out))
     rc, out = run_cmd(cmd, cwd=None)
     if log_fn:
         log_fn("== ffmpeg mux ==")
@@ -1184,7 +2068,7 @@ def pad_or_trim_to_video_length(dub_wav: Path, video_in: Path, out_wav: Path, lo
     if log_fn:
         log_fn(f"final_audio_target_sec={vd:.4f}")
         log_fn(out)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"final pad/trim failed (rc={rc})\n{tail}")
 
@@ -1193,22 +2077,83 @@ def pad_or_trim_to_video_length(dub_wav: Path, video_in: Path, out_wav: Path, lo
 # Pitch and gender heuristic
 # -----------------------------------------------------------------------------
 
+def _wav_data_offset(path: Path) -> int:
+    """Byte offset of the PCM payload (the RIFF `data` chunk)."""
+    with open(path, "rb") as f:
+        hdr = f.read(12)
+        if hdr[:4] != b"RIFF" or hdr[8:12] != b"WAVE":
+            raise wave.Error("not a RIFF/WAVE file")
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                raise wave.Error("no data chunk")
+            size = int.from_bytes(chunk[4:], "little")
+            if chunk[:4] == b"data":
+                return f.tell()
+            f.seek(size + (size & 1), os.SEEK_CUR)
+
+
 def _read_wav_mono(path: Path) -> Tuple[np.ndarray, int]:
+    # wave.open only accepts PCM (format tag 1); the mapping below additionally assumes 16-bit.
     with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise wave.Error(f"unsupported sample width {wf.getsampwidth()}")
         ch = wf.getnchannels()
         sr = wf.getframerate()
         n = wf.getnframes()
-        raw = wf.readframes(n)
 
-    x = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    if n == 0:
+        return np.zeros(0, dtype=np.float32), sr
+    # Map the PCM rather than readframes(): the float conversion reads straight from the page
+    # cache, with no full-size bytes copy of the file in between.
+    pcm = np.memmap(path, dtype="<i2", mode="r", offset=_wav_data_offset(path), shape=(n * ch,))
+    x = pcm.astype(np.float32)
+    del pcm
+    x /= 32768.0
     if ch > 1:
         x = x.reshape(-1, ch).mean(axis=1)
     return x, sr
 
 
-def estimate_median_f0(audio_wav: Path, sr_expected: int = 16000) -> Optional[float]:
+def extract_pcm16k_mono(media_path: Path) -> np.ndarray:
+    """
+    Decode the first audio stream of any container in-process (PyAV, shipped with faster-whisper)
+    to 16 kHz mono float32 in [-1, 1] -- the layout Whisper consumes, with no ffmpeg fork or temp WAV.
+    """
+    import av
+
+    chunks: List[np.ndarray] = []
+    with av.open(str(media_path)) as container:
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=16000)
+        for frame in container.decode(audio=0):
+            for out in resampler.resample(frame):
+                chunks.append(out.to_ndarray().reshape(-1))
+        for out in resampler.resample(None):
+            chunks.append(out.to_ndarray().reshape(-1))
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32) / 32768.0
+
+
+def load_pcm16k_mono(media_path: Path) -> np.ndarray:
+    """Our own audio.wav is already 16 kHz mono s16: read it directly; decode anything else."""
     try:
-        x, sr = _read_wav_mono(audio_wav)
+        x, sr = _read_wav_mono(media_path)
+        if sr == 16000:
+            return x
+    except (wave.Error, EOFError, ValueError):
+        # ValueError: np.memmap when the header claims more frames than the file holds.
+        pass
+    return extract_pcm16k_mono(media_path)
+
+
+def estimate_median_f0(audio_wav: Any, sr_expected: int = 16000) -> Optional[float]:
+    """`audio_wav` is a WAV path or 16 kHz mono samples from load_pcm16k_mono."""
+    try:
+        if isinstance(audio_wav, np.ndarray):
+            x, sr = audio_wav, sr_expected
+        else:
+            x, sr = _read_wav_mono(audio_wav)
         if sr != sr_expected:
             sr = sr_expected
 
@@ -1278,9 +2223,16 @@ def infer_gender_from_f0(f0_hz: Optional[float]) -> str:
 # Transcribe + translate
 # -----------------------------------------------------------------------------
 
-def whisper_transcribe(audio_path: Path) -> Dict[str, Any]:
+def whisper_transcribe(audio: Any, lang_hint: Optional[str] = WHISPER_LANGUAGE) -> Dict[str, Any]:
+    """`audio` is a media path or 16 kHz mono float32 samples (see load_pcm16k_mono)."""
     whisper = _get_whisper()
-    segments, info = whisper.transcribe(str(audio_path), beam_size=2)
+    segments, info = whisper.transcribe(
+        audio if isinstance(audio, np.ndarray) else str(audio),
+        language=lang_hint,
+        beam_size=WHISPER_BEAM_SIZE,
+        vad_filter=WHISPER_VAD,
+        vad_parameters={"min_silence_duration_ms": 500} if WHISPER_VAD else None,
+    )
     seg_list: List[Dict[str, Any]] = []
     full: List[str] = []
     for s in segments:
@@ -1321,6 +2273,119 @@ def split_into_sentences(text: str) -> List[str]:
 
 _translate_cache: Dict[str, str] = {}
 
+# Content-addressed on-disk copy of successful translations, so repeated dubs of the same video
+# (retries, other instances of this worker after a restart) skip the provider/NLLB entirely.
+TRANSLATION_CACHE_DIR = DATA_DIR / "translations"
+
+
+def _translation_cache_path(cache_key: str) -> Path:
+    backend = f"nllb:{NLLB_MODEL}:{NLLB_BEAMS}" if ENABLE_LOCAL_NLLB else TRANSLATE_PROVIDER
+    h = hashlib.blake2b(f"{backend}|{cache_key}".encode("utf-8"), digest_size=16).hexdigest()
+    return TRANSLATION_CACHE_DIR / h[:2] / h
+
+
+def cached_translation(cache_key: str) -> Optional[str]:
+    hit = _translate_cache.get(cache_key)
+    if hit is not None:
+        return hit
+    try:
+        hit = _translation_cache_path(cache_key).read_bytes().decode("utf-8")
+    except OSError:
+        return None
+    _translate_cache[cache_key] = hit
+    return hit
+
+
+def store_translation(cache_key: str, translated: str) -> None:
+    _translate_cache[cache_key] = translated
+    if not translated.strip():
+        return
+    try:
+        atomic_write_bytes(_translation_cache_path(cache_key), translated.encode("utf-8"))
+    except OSError as e:
+        print(f"WARNING: translation cache write failed: {e}")
+
+
+NLLB_LANG_CODES = {"en": "eng_Latn", "hi": "hin_Deva", "es": "spa_Latn"}
+
+
+def _nllb_max_new_tokens(input_len: int) -> int:
+    # A translation runs ~1.2x its source length; leave headroom but stop runaway decodes early.
+    return min(int(input_len * 1.5) + 16, 256)
+
+
+def nllb_translate_batch(texts: List[str], tgt: str) -> List[str]:
+    """
+    Translate `texts` with local NLLB into the NLLB language code `tgt`
+    (CTranslate2 int8 when NLLB_CT2_DIR is set).
+    Inputs are sorted by length and run NLLB_BATCH_SIZE at a time to keep padding low;
+    outputs come back in input order.
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    out: List[str] = [""] * len(texts)
+    for b in range(0, len(order), max(1, NLLB_BATCH_SIZE)):
+        idxs = order[b : b + max(1, NLLB_BATCH_SIZE)]
+        batch = [texts[i] for i in idxs]
+
+        if NLLB_CT2_DIR:
+            tok, translator = _get_nllb_ct2()
+            tokens = [tok.convert_ids_to_tokens(tok.encode(t, truncation=True, max_length=512)) for t in batch]
+            res = translator.translate_batch(
+                tokens,
+                target_prefix=[[tgt]] * len(batch),
+                beam_size=NLLB_BEAMS,
+                max_decoding_length=_nllb_max_new_tokens(max(len(t) for t in tokens)),
+            )
+            # hypotheses[0][0] is the forced target-language token
+            decoded = [
+                tok.decode(tok.convert_tokens_to_ids(r.hypotheses[0][1:]), skip_special_tokens=True) for r in res
+            ]
+        else:
+            import torch
+
+            tok, model, bf16 = _get_nllb()
+            inputs = tok(batch, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            forced_bos = tok.convert_tokens_to_ids(tgt)
+            with torch.inference_mode(), torch.autocast("cpu", dtype=torch.bfloat16, enabled=bf16):
+                gen = model.generate(
+                    **inputs,
+                    forced_bos_token_id=forced_bos,
+                    max_new_tokens=_nllb_max_new_tokens(inputs["input_ids"].shape[1]),
+                    num_beams=NLLB_BEAMS,
+                    do_sample=False,
+                )
+            decoded = tok.batch_decode(gen, skip_special_tokens=True)
+
+        for i, t in zip(idxs, decoded):
+            out[i] = t.strip()
+    return out
+
+
+def nllb_translate(text: str, tgt: str) -> str:
+    return nllb_translate_batch([text], tgt)[0]
+
+
+def translate_texts(texts: List[str], target_lang: str) -> List[str]:
+    """
+    Batched translate_text. With local NLLB, every uncached text goes through one
+    nllb_translate_batch call; other providers translate one text at a time.
+    """
+    tgt = NLLB_LANG_CODES.get(target_lang)
+    if not ENABLE_LOCAL_NLLB or target_lang == "en" or not tgt:
+        return [translate_text(t, target_lang) for t in texts]
+
+    cleaned = [clean_text_for_translation(_truncate(t, MAX_TRANSCRIPT_CHARS)) for t in texts]
+    todo = sorted({c for c in cleaned if c and cached_translation(f"{target_lang}::{c}") is None})
+    if todo:
+        try:
+            for c, translated in zip(todo, nllb_translate_batch(todo, tgt)):
+                store_translation(f"{target_lang}::{c}", translated)
+        except Exception:
+            # Never hard-fail dubbing due to translation provider issues
+            for c in todo:
+                _translate_cache[f"{target_lang}::{c}"] = c
+    return [_translate_cache[f"{target_lang}::{c}"] if c else "" for c in cleaned]
+
 
 def translate_text(text: str, target_lang: str) -> str:
     text = _truncate(text, MAX_TRANSCRIPT_CHARS)
@@ -1331,22 +2396,18 @@ def translate_text(text: str, target_lang: str) -> str:
         return text
 
     cache_key = f"{target_lang}::{text}"
-    if cache_key in _translate_cache:
-        return _translate_cache[cache_key]
+    hit = cached_translation(cache_key)
+    if hit is not None:
+        return hit
 
     try:
         if ENABLE_LOCAL_NLLB:
-            tok, model = _get_nllb()
-            tgt_map = {"en": "eng_Latn", "hi": "hin_Deva", "es": "spa_Latn"}
-            tgt = tgt_map.get(target_lang)
+            tgt = NLLB_LANG_CODES.get(target_lang)
             if not tgt:
                 _translate_cache[cache_key] = text
                 return text
-            inputs = tok(text, return_tensors="pt", truncation=True, max_length=1024)
-            forced_bos = tok.convert_tokens_to_ids(tgt)
-            out = model.generate(**inputs, forced_bos_token_id=forced_bos, max_new_tokens=512)
-            translated = tok.batch_decode(out, skip_special_tokens=True)[0].strip()
-            _translate_cache[cache_key] = translated
+            translated = nllb_translate(text, tgt)
+            store_translation(cache_key, translated)
             return translated
 
         if TRANSLATE_PROVIDER == "libretranslate":
@@ -1357,15 +2418,14 @@ def translate_text(text: str, target_lang: str) -> str:
             payload = {"q": text, "source": "auto", "target": target_lang, "format": "text"}
             if api_key:
                 payload["api_key"] = api_key
-            data = json.dumps(payload).encode("utf-8")
+            data = json_dumps_bytes(payload)
             req = urllib.request.Request(
                 url=f"{base}/translate", data=data, headers={"Content-Type": "application/json"}, method="POST"
             )
             with urllib.request.urlopen(req, timeout=30) as resp:
-                body = resp.read().decode("utf-8", errors="ignore")
-            out = json.loads(body)
+                out = json_loads(resp.read())
             translated = (out.get("translatedText") or "").strip()
-            _translate_cache[cache_key] = translated
+            store_translation(cache_key, translated)
             return translated
 
         # Default: google_free
@@ -1375,10 +2435,9 @@ def translate_text(text: str, target_lang: str) -> str:
             f"?client=gtx&sl=auto&tl={urllib.parse.quote(target_lang)}&dt=t&q={q}"
         )
         with urllib.request.urlopen(url, timeout=30) as resp:
-            raw = resp.read().decode("utf-8", errors="ignore")
-        arr = json.loads(raw)
+            arr = json_loads(resp.read())
         translated = "".join([chunk[0] for chunk in arr[0] if chunk and chunk[0]]).strip()
-        _translate_cache[cache_key] = translated
+        store_translation(cache_key, translated)
         return translated
     except Exception:
         # Never hard-fail dubbing due to translation provider issues
@@ -1390,9 +2449,6 @@ def translate_text(text: str, target_lang: str) -> str:
 # TTS
 # -----------------------------------------------------------------------------
 
-import asyncio
-
-
 def _edge_voice_for(lang: str, gender: str = "unknown") -> str:
     """
     gender: male | female | unknown
@@ -1467,7 +2523,7 @@ async def _edge_tts_to_mp3_async(
     communicate = edge_tts.Communicate(text=text, voice=voice, rate=rate, volume=volume, pitch=pitch)
     await communicate.save(str(out_mp3))
 
-    if not out_mp3.exists() or out_mp3.stat().st_size < 1024:
+    if not _file_ready(out_mp3, 1024):
         raise RuntimeError("edge-tts produced empty audio")
 
 
@@ -1498,7 +2554,7 @@ def tts_edge(text: str, lang: str, out_wav: Path, rate: str, log_fn=None, gender
 
     if log_fn:
         log_fn(out)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"ffmpeg convert failed (rc={rc})\n{tail}")
 
@@ -1511,14 +2567,47 @@ def tts_espeak(text: str, lang: str, out_wav: Path) -> None:
     text = _safe_text_for_tts(text)
     voice = _espeak_voice_for(lang)
     tmp = out_wav.with_suffix(".espeak.wav")
-    cmd = ["espeak-ng", "-v", voice, "-w", str(tmp), "--stdin"]
+    cmd = [require_bin("espeak-ng"), "-v", voice, "-w", str(tmp), "--stdin"]
     proc = subprocess.run(cmd, input=text, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     if proc.returncode != 0:
         raise RuntimeError(f"espeak-ng failed (rc={proc.returncode})\n{proc.stdout[-2000:]}")
     ffmpeg_bin = require_bin("ffmpeg")
     rc, out = run_cmd([ffmpeg_bin, "-y", "-i", str(tmp), "-ac", "1", "-ar", "16000", str(out_wav)], cwd=None)
     tmp.unlink(missing_ok=True)
-    if rc != 0 or (not out_wav.exists()) or out_wav.stat().st_size < 2048:
+    if rc != 0 or not _file_ready(out_wav, 2048):
+        tail = "\n".join(out.splitlines()[-200:])
+        raise RuntimeError(f"ffmpeg convert failed (rc={rc})\n{tail}")
+
+
+@lru_cache(maxsize=8)
+def _get_piper_voice(lang: str):
+    # Imported here, not at module top: piper pulls in onnxruntime, which every spawned dub worker
+    # would otherwise pay for at import time even when TTS_PROVIDER is not piper.
+    try:
+        from piper.voice import PiperVoice  # type: ignore
+    except Exception:
+        raise RuntimeError("piper-tts not installed")
+    name = (os.getenv(f"PIPER_VOICE_{lang.upper()}") or PIPER_VOICES.get(lang) or PIPER_VOICES["en"]).strip()
+    model = Path(name) if name.endswith(".onnx") else PIPER_VOICES_DIR / f"{name}.onnx"
+    if not model.exists():
+        raise RuntimeError(f"piper voice not found: {model}")
+    return PiperVoice.load(str(model))
+
+
+def tts_piper(text: str, lang: str, out_wav: Path) -> None:
+    text = _safe_text_for_tts(text)
+    if not text:
+        raise RuntimeError("TTS text empty")
+    voice = _get_piper_voice(lang)
+    tmp = out_wav.with_suffix(".piper.wav")
+    with wave.open(str(tmp), "wb") as wf:
+        # piper-tts >= 1.3 renamed synthesize(text, wav_file) to synthesize_wav
+        synth = getattr(voice, "synthesize_wav", None) or voice.synthesize
+        synth(text, wf)
+    ffmpeg_bin = require_bin("ffmpeg")
+    rc, out = run_cmd([ffmpeg_bin, "-y", "-i", str(tmp), "-ac", "1", "-ar", "16000", str(out_wav)], cwd=None)
+    tmp.unlink(missing_ok=True)
+    if rc != 0 or not _file_ready(out_wav, 2048):
         tail = "\n".join(out.splitlines()[-200:])
         raise RuntimeError(f"ffmpeg convert failed (rc={rc})\n{tail}")
 
@@ -1551,11 +2640,16 @@ def tts_speak(text: str, lang: str, out_wav: Path, log_fn=None, gender: str = "u
             def try_espeak():
                 tts_espeak(sentence, lang, tmp_wav)
 
+            def try_piper():
+                tts_piper(sentence, lang, tmp_wav)
+
             attempts: List[Tuple[str, Any]] = []
             if provider == "edge":
                 attempts = [("edge", try_edge)]
             elif provider == "espeak":
                 attempts = [("espeak", try_espeak)]
+            elif provider == "piper":
+                attempts = [("piper", try_piper), ("espeak", try_espeak)]
             else:
                 attempts = [("edge", try_edge), ("espeak", try_espeak)]
 
@@ -1579,6 +2673,14 @@ def tts_speak(text: str, lang: str, out_wav: Path, log_fn=None, gender: str = "u
         return
 
     last = None
+    if provider == "piper":
+        try:
+            tts_piper(text, lang, out_wav)
+            return
+        except Exception as e:
+            last = f"piper: {e}"
+            if log_fn:
+                log_fn(f"piper_failed={e}")
     if provider in {"auto", "edge"}:
         try:
             tts_edge(text, lang, out_wav, rate=_base_rate_for_lang(lang), log_fn=None, gender=gender)
@@ -1587,7 +2689,7 @@ def tts_speak(text: str, lang: str, out_wav: Path, log_fn=None, gender: str = "u
             last = f"edge: {e}"
             if log_fn:
                 log_fn(f"edge_failed={e}")
-    if provider in {"auto", "espeak"}:
+    if provider in {"auto", "espeak", "piper"}:
         try:
             tts_espeak(text, lang, out_wav)
             return
@@ -1684,12 +2786,36 @@ def dub_runner_log_path(job_id: str, lang: str) -> Path:
     return dub_dir(job_id, lang) / "runner.log"
 
 
+def dub_analysis_path(job_id: str) -> Path:
+    # Language-independent results (transcript, speaker F0), shared by every dub of the job.
+    return dub_dir(job_id, "_shared") / "analysis.json"
+
+
+def _dub_analysis_key(audio_in: Path) -> str:
+    # Identity of the source audio plus the settings that shape the transcript.
+    st = audio_in.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}:{WHISPER_MODEL}:{WHISPER_LANGUAGE}:{WHISPER_BEAM_SIZE}:{WHISPER_VAD}"
+
+
+def load_dub_analysis(job_id: str, audio_in: Path) -> Dict[str, Any]:
+    try:
+        data = json_loads(dub_analysis_path(job_id).read_bytes())
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) and data.get("key") == _dub_analysis_key(audio_in) else {}
+
+
+def save_dub_analysis(job_id: str, audio_in: Path, analysis: Dict[str, Any]) -> None:
+    try:
+        atomic_write_bytes(dub_analysis_path(job_id), json_dumps_bytes({**analysis, "key": _dub_analysis_key(audio_in)}))
+    except Exception as e:
+        print(f"WARNING: save_dub_analysis failed: {e}")
+
+
 def write_dub_status(job_id: str, lang: str, status: str, error: Optional[str] = None) -> None:
-    p = dub_status_path(job_id, lang)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(
-        p,
-        json.dumps({"job_id": job_id, "lang": lang, "status": status, "error": error, "updated_at": now_iso()}, indent=2),
+    atomic_write_bytes(
+        dub_status_path(job_id, lang),
+        json_dumps_bytes({"job_id": job_id, "lang": lang, "status": status, "error": error, "updated_at": now_iso()}),
     )
     sb_upsert_dub_status(job_id, lang, status, error=error)
 
@@ -1698,9 +2824,29 @@ def write_dub_status(job_id: str, lang: str, status: str, error: Optional[str] =
 # Base job processing
 # -----------------------------------------------------------------------------
 
-def yt_dlp_supports(yt_dlp_bin: str, flag: str) -> bool:
-    rc, out = run_cmd([yt_dlp_bin, "--help"], cwd=None)
-    return rc == 0 and (flag in out)
+_YTDLP_FLAG_RE = re.compile(r"--[a-z0-9][a-z0-9-]*")
+# yt-dlp binary -> long options it accepts (empty when the --help probe failed).
+_YTDLP_FLAGS: Dict[str, frozenset] = {}
+
+
+def yt_dlp_supported_flags(yt_dlp_bin: str) -> frozenset:
+    """Long options this yt-dlp build accepts; one --help read per binary, warmed at startup."""
+    flags = _YTDLP_FLAGS.get(yt_dlp_bin)
+    if flags is not None:
+        return flags
+    try:
+        rc, out = run_cmd([yt_dlp_bin, "--help"], cwd=None, tail_bytes=None)
+    except Exception:
+        rc, out = -1, ""
+    # A build whose --help fails will not start working mid-process: cache the empty set as well,
+    # otherwise every job would pay for the failing fork again.
+    flags = _YTDLP_FLAGS[yt_dlp_bin] = frozenset(_YTDLP_FLAG_RE.findall(out)) if rc == 0 else frozenset()
+    return flags
+
+
+@lru_cache(maxsize=1)
+def _cookies_b64_bytes(b64: str) -> bytes:
+    return base64.b64decode(b64.encode("utf-8"))
 
 
 def materialize_cookies(tmp_job_dir: Path, log_lines: List[str]) -> Optional[Path]:
@@ -1718,10 +2864,12 @@ def materialize_cookies(tmp_job_dir: Path, log_lines: List[str]) -> Optional[Pat
         return None
 
     try:
+        # Decoded once per process. Each job still gets its own copy: yt-dlp writes the cookie
+        # jar back on exit, and concurrent jobs must not rewrite a shared file (or inode).
         cookies_path = tmp_job_dir / "cookies.txt"
-        raw = base64.b64decode(b64.encode("utf-8"))
-        cookies_path.write_bytes(raw)
-        os.chmod(cookies_path, 0o600)
+        fd = os.open(cookies_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_cookies_b64_bytes(b64))
         log_lines.append("cookies=materialized_b64")
         return cookies_path
     except Exception as e:
@@ -1729,70 +2877,279 @@ def materialize_cookies(tmp_job_dir: Path, log_lines: List[str]) -> Optional[Pat
         return None
 
 
-def process_job(job_id: str, url: str) -> None:
-    with JOB_SEM:
-        tmp_job_dir = TMP_DIR / job_id
-        tmp_job_dir.mkdir(parents=True, exist_ok=True)
-        paths = _job_artifact_paths(job_id)
-        paths["job_dir"].mkdir(parents=True, exist_ok=True)
-        out_template = "download.%(ext)s"
-        out_log = paths["log"]
-        runner_log = paths["runner_log"]
+def url_index_path(url: str, audio_only: bool = False) -> Path:
+    parts = urllib.parse.urlsplit(url.strip())
+    normalized = urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+    h = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return URL_INDEX_DIR / (f"{h}.audio.json" if audio_only else f"{h}.json")
+
+
+def record_url_index(url: str, job_id: str, audio_only: bool = False) -> None:
+    try:
+        atomic_write_bytes(url_index_path(url, audio_only), json_dumps_bytes({"job_id": job_id, "url": url}), durable=True)
+    except Exception as e:
+        print(f"WARNING: record_url_index failed: {e}")
 
-        update_job(
-            job_id,
-            {
-                "status": "running",
-                "updated_at": now_iso(),
-                "updated_at_ts": time.time(),
-                "log_path": str(out_log.resolve()),
-                "runner_log_path": str(runner_log.resolve()),
-            },
-        )
 
-        log_lines: List[str] = []
+def link_cached_artifacts(job_id: str, url: str, audio_only: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    If a finished job already downloaded `url`, hardlink its artifacts into `job_id`
+    and return the job patch. Returns None on any miss.
+    """
+    candidates = [url_index_path(url, True), url_index_path(url, False)] if audio_only else [url_index_path(url, False)]
+    for idx in candidates:
         try:
-            yt_dlp_bin = require_bin("yt-dlp")
-            ffmpeg_bin = require_bin("ffmpeg")
-
-            log_lines.append("== ENV ==")
-            log_lines.append(f"BUILD_TAG={BUILD_TAG}")
-            log_lines.append(f"yt-dlp={yt_dlp_bin}")
-            log_lines.append(f"ffmpeg={ffmpeg_bin}")
-            log_lines.append(f"DATA_DIR={DATA_DIR}")
-            log_lines.append(f"TMP_DIR={TMP_DIR}")
-            log_lines.append(f"job_dir={paths['job_dir']}")
-            log_lines.append(f"tmp_job_dir={tmp_job_dir}")
-
-            cookies_file = materialize_cookies(tmp_job_dir, log_lines)
-            cookies_args: List[str] = ["--cookies", str(cookies_file)] if cookies_file else []
-
-            dl_cmd: List[str] = [
-                yt_dlp_bin,
-                "--no-playlist",
-                "--newline",
-                "--retries",
-                "5",
-                "--fragment-retries",
-                "5",
-                "--socket-timeout",
-                "30",
-                "--concurrent-fragments",
-                "2",
-                "--sleep-interval",
+            src_id = str(json_loads(idx.read_bytes()).get("job_id") or "")
+        except Exception:
+            continue
+        src = load_job_local(src_id) if src_id else None
+        if not src or src.get("status") != "done":
+            continue
+
+        src_paths = _job_artifact_paths(src_id)
+        dst_paths = _job_artifact_paths(job_id)
+        names = ["audio"] if audio_only else ["audio", "video"]
+        if not all(src_paths[n].exists() for n in names):
+            continue
+        try:
+            for n in names:
+                dst_paths[n].unlink(missing_ok=True)
+                os.link(src_paths[n], dst_paths[n])
+            atomic_write_bytes(dst_paths["log"], f"url_cache=hit reused_from={src_id}\n".encode("utf-8"))
+        except OSError:
+            continue
+
+        return {
+            "status": "done",
+            "error": None,
+            "reused_from": src_id,
+            "video_path": None if audio_only else str(dst_paths["video"].resolve()),
+            "audio_path": str(dst_paths["audio"].resolve()),
+            "storage_video_key": None if audio_only else src.get("storage_video_key"),
+            "storage_audio_key": src.get("storage_audio_key"),
+        }
+    return None
+
+
+async def process_job(job_id: str, url: str, audio_only: bool = False) -> None:
+    tmp_job_dir = TMP_DIR / job_id
+    tmp_job_dir.mkdir(parents=True, exist_ok=True)
+    paths = _job_artifact_paths(job_id)
+    paths["job_dir"].mkdir(parents=True, exist_ok=True)
+    out_template = "download.%(ext)s"
+    out_log = paths["log"]
+
+    # register_job already wrote the full record (log paths included); starting is just the
+    # queued -> running flip, applied to the in-memory registry (no re-read, flushed later).
+    job = await asyncio.to_thread(update_job, job_id, {"status": "running", **updated_stamp()})
+
+    # Progress goes to the local runner log immediately; the Supabase copy is buffered and
+    # written once in `finally`, instead of a SELECT + UPDATE of the whole log_text per call.
+    sb_log_buf: List[str] = []
+
+    def append_log(text: str) -> None:
+        runner_log_write(job_id, text)
+        sb_log_buf.append(text if text.endswith("\n") else text + "\n")
+
+    log_lines: List[str] = []
+    log_flushed = 0
+
+    def flush_log_lines() -> None:
+        # Forward only entries added since the last call, so nothing is re-joined or logged twice.
+        nonlocal log_flushed
+        if log_flushed < len(log_lines):
+            append_log("\n".join(log_lines[log_flushed:]) + "\n")
+            log_flushed = len(log_lines)
+
+    try:
+        yt_dlp_bin = require_bin("yt-dlp")
+        ffmpeg_bin = require_bin("ffmpeg")
+
+        log_lines.append("== ENV ==")
+        log_lines.append(f"BUILD_TAG={BUILD_TAG}")
+        log_lines.append(f"yt-dlp={yt_dlp_bin}")
+        log_lines.append(f"ffmpeg={ffmpeg_bin}")
+        log_lines.append(f"DATA_DIR={DATA_DIR}")
+        log_lines.append(f"TMP_DIR={TMP_DIR}")
+        log_lines.append(f"job_dir={paths['job_dir']}")
+        log_lines.append(f"tmp_job_dir={tmp_job_dir}")
+
+        cookies_file = materialize_cookies(tmp_job_dir, log_lines)
+        cookies_args: List[str] = ["--cookies", str(cookies_file)] if cookies_file else []
+
+        dl_cmd: List[str] = [
+            yt_dlp_bin,
+            "--no-playlist",
+            "--newline",
+            "--retries",
+            "5",
+            "--fragment-retries",
+            "5",
+            "--socket-timeout",
+            "30",
+            "--concurrent-fragments",
+            str(YTDLP_CONCURRENT_FRAGMENTS),
+            # Back off only when throttled (429/5xx retries) instead of sleeping before every download.
+            "--retry-sleep",
+            "http:exp=1:20",
+            "--retry-sleep",
+            "fragment:exp=1:20",
+            "--extractor-args",
+            "youtube:player_client=web",
+            # The ffmpeg we resolved (FFMPEG_BIN or PATH), so yt-dlp's own merge/postprocessing
+            # in the merged-download fallback never depends on a separate PATH lookup.
+            "--ffmpeg-location",
+            ffmpeg_bin,
+        ]
+        if cookies_file:
+            # Logged-in sessions are the ones YouTube rate-limits per account; keep pacing them.
+            dl_cmd += ["--sleep-interval", "1", "--max-sleep-interval", "3"]
+        # Warmed at startup, so this is normally a dict hit with no thread hop.
+        ytdlp_flags = _YTDLP_FLAGS.get(yt_dlp_bin)
+        if ytdlp_flags is None:
+            ytdlp_flags = await asyncio.to_thread(yt_dlp_supported_flags, yt_dlp_bin)
+        if "--js-runtimes" in ytdlp_flags:
+            dl_cmd += ["--js-runtimes", "node"]
+            log_lines.append("js_runtime=enabled(--js-runtimes node)")
+        if "--remote-components" in ytdlp_flags:
+            dl_cmd += ["--remote-components", "ejs:github"]
+            log_lines.append("remote_components=enabled(ejs:github)")
+
+        # aria2c cannot write to stdout, so the piped audio-only download keeps the native downloader.
+        aria2c_bin = which_cached("aria2c")
+        if aria2c_bin and not audio_only:
+            dl_cmd += ["--downloader", "aria2c", "--downloader-args", f"aria2c:{YTDLP_ARIA2C_ARGS}"]
+            log_lines.append(f"downloader=aria2c({aria2c_bin})")
+
+        tmp_audio = tmp_job_dir / "audio.wav"
+        merged_video: Optional[Path] = None
+
+        split_streams: Optional[Tuple[Path, Path]] = None
+        if YTDLP_SPLIT_STREAMS and not audio_only:
+            # %(vcodec)s is "none" for the audio-only format, which tells the two files apart.
+            split_cmd = dl_cmd + [
+                "-S",
+                "ext:mp4:m4a,codec:h264",
+                "-f",
+                "bv,ba",
+                "-o",
+                "download.%(vcodec)s.%(ext)s",
+                *cookies_args,
+                str(url),
+            ]
+
+            async with DOWNLOAD_SEM:
+                rc, out = await run_cmd_async(split_cmd, cwd=tmp_job_dir, output_path=tmp_job_dir / "yt-dlp.out")
+            out = out[-20000:]
+            log_lines.append("== yt-dlp (split streams) ==")
+            log_lines.append(out)
+
+            streams = [p for p in tmp_job_dir.glob("download.*") if p.suffix not in {".part", ".ytdl"}]
+            audio_src = next((p for p in streams if p.name.startswith("download.none.")), None)
+            video_src = next((p for p in streams if not p.name.startswith("download.none.")), None)
+            if rc == 0 and audio_src is not None and video_src is not None:
+                split_streams = (video_src, audio_src)
+            else:
+                # Typically a site that only serves combined formats: fall back to a merged download.
+                log_lines.append("split streams unavailable; falling back to merged download")
+                for p in tmp_job_dir.glob("download.*"):
+                    p.unlink(missing_ok=True)
+            flush_log_lines()
+
+        if audio_only:
+            # yt-dlp streams the audio track to stdout straight into ffmpeg: no intermediate file on disk.
+            dl_cmd += ["-f", "ba/best", "-o", "-", *cookies_args, str(url)]
+            ff_cmd = [
+                ffmpeg_bin,
+                "-y",
+                "-i",
+                "pipe:0",
+                "-vn",
+                "-sn",
+                "-dn",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "pcm_s16le",
+                "-threads",
+                "1",
+                "-f",
+                "wav",
+                str(tmp_audio),
+            ]
+            # The pipe is paced by the network, so it only counts against the download pool.
+            async with DOWNLOAD_SEM:
+                rc, rc2, out, out2 = await run_piped_async(dl_cmd, ff_cmd, cwd=tmp_job_dir)
+            out = out[-20000:]
+            out2 = out2[-20000:]
+            log_lines.append("== yt-dlp (audio only, piped) ==")
+            log_lines.append(out)
+            log_lines.append("== ffmpeg extract ==")
+            log_lines.append(out2)
+            flush_log_lines()
+
+            if rc != 0:
+                tail = "\n".join(out.splitlines()[-200:])
+                append_log("\nERROR: download failed\n" + tail + "\n")
+                raise RuntimeError(f"download failed (rc={rc})\n{tail}")
+            if rc2 != 0:
+                tail = "\n".join(out2.splitlines()[-200:])
+                append_log("\nERROR: audio extraction failed\n" + tail + "\n")
+                raise RuntimeError(f"audio extraction failed (rc={rc2})\n{tail}")
+        elif split_streams is not None:
+            video_src, audio_src = split_streams
+            # One pass: the streams are remuxed (no re-encode) into the job dir and the audio track is
+            # resampled to wav, so neither input is read twice and video.mp4 never needs a move.
+            video_part = paths["job_dir"] / "video.part.mp4"
+            ff_cmd = [
+                ffmpeg_bin,
+                "-nostdin",
+                "-y",
+                "-i",
+                str(video_src),
+                "-i",
+                str(audio_src),
+                "-map",
+                "0:v:0",
+                "-map",
+                "1:a:0",
+                "-c",
+                "copy",
+                "-movflags",
+                "+faststart",
+                str(video_part),
+                "-map",
+                "1:a:0",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "pcm_s16le",
+                "-threads",
                 "1",
-                "--max-sleep-interval",
-                "3",
-                "--extractor-args",
-                "youtube:player_client=web",
+                "-f",
+                "wav",
+                str(tmp_audio),
             ]
-            if yt_dlp_supports(yt_dlp_bin, "--js-runtimes"):
-                dl_cmd += ["--js-runtimes", "node"]
-                log_lines.append("js_runtime=enabled(--js-runtimes node)")
-            if yt_dlp_supports(yt_dlp_bin, "--remote-components"):
-                dl_cmd += ["--remote-components", "ejs:github"]
-                log_lines.append("remote_components=enabled(ejs:github)")
+            async with FFMPEG_SEM:
+                rc2, out2 = await run_cmd_async(
+                    ff_cmd, cwd=None, cpuset=next_cpuset(), output_path=tmp_job_dir / "ffmpeg.out"
+                )
+            out2 = out2[-20000:]
+            log_lines.append("== ffmpeg mux + extract ==")
+            log_lines.append(out2)
+            flush_log_lines()
 
+            if rc2 != 0:
+                tail = "\n".join(out2.splitlines()[-200:])
+                append_log("\nERROR: mux/extract failed\n" + tail + "\n")
+                raise RuntimeError(f"mux/extract failed (rc={rc2})\n{tail}")
+
+            os.replace(video_part, paths["video"])
+        else:
             dl_cmd += [
                 "-S",
                 "ext:mp4:m4a,codec:h264",
@@ -1806,171 +3163,150 @@ def process_job(job_id: str, url: str) -> None:
                 str(url),
             ]
 
-            rc, out = run_cmd(dl_cmd, cwd=tmp_job_dir)
+            async with DOWNLOAD_SEM:
+                rc, out = await run_cmd_async(dl_cmd, cwd=tmp_job_dir, output_path=tmp_job_dir / "yt-dlp.out")
             out = out[-20000:]
             log_lines.append("== yt-dlp ==")
             log_lines.append(out)
-            sb_append_log(job_id, "\n".join(log_lines[-80:]) + "\n")
+            flush_log_lines()
 
             if rc != 0:
                 tail = "\n".join(out.splitlines()[-200:])
                 log_lines.append("== tmp dir listing ==")
                 log_lines.append(list_dir(tmp_job_dir))
-                sb_append_log(job_id, "\nERROR: download failed\n" + tail + "\n")
+                append_log("\nERROR: download failed\n" + tail + "\n")
                 raise RuntimeError(f"download failed (rc={rc})\n{tail}")
 
-            mp4s = sorted(tmp_job_dir.glob("download*.mp4"), key=lambda p: p.stat().st_size, reverse=True)
-            if not mp4s:
+            merged_video = largest_file(tmp_job_dir, "download", ".mp4")
+            if merged_video is None:
                 log_lines.append("== tmp dir listing ==")
                 log_lines.append(list_dir(tmp_job_dir))
-                sb_append_log(job_id, "\nERROR: no mp4 produced\n")
+                append_log("\nERROR: no mp4 produced\n")
                 raise RuntimeError("download produced no mp4")
 
-            merged_video = mp4s[0]
-            if not wait_for_file(merged_video, min_bytes=1024 * 200):
-                sb_append_log(job_id, "\nERROR: mp4 too small/not ready\n")
+            # yt-dlp has exited, so the file is closed: one stat() settles it, there is nothing to wait for.
+            if not _file_ready(merged_video, 1024 * 200):
+                append_log("\nERROR: mp4 too small/not ready\n")
                 raise RuntimeError("mp4 too small or not ready")
 
-            tmp_audio = tmp_job_dir / "audio.wav"
-            ff_cmd = [ffmpeg_bin, "-y", "-i", str(merged_video), "-ac", "1", "-ar", "16000", str(tmp_audio)]
-            rc2, out2 = run_cmd(ff_cmd, cwd=None)
+            # Only the audio track is needed: -vn/-sn/-dn and -map 0:a:0 keep the h264 decoder (and its
+            # thread pool) out of the pipeline; one thread is plenty for an aac -> pcm resample.
+            ff_cmd = [
+                ffmpeg_bin,
+                "-nostdin",
+                "-y",
+                "-i",
+                str(merged_video),
+                "-vn",
+                "-sn",
+                "-dn",
+                "-map",
+                "0:a:0",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "pcm_s16le",
+                "-threads",
+                "1",
+                "-f",
+                "wav",
+                str(tmp_audio),
+            ]
+            async with FFMPEG_SEM:
+                rc2, out2 = await run_cmd_async(
+                    ff_cmd, cwd=None, cpuset=next_cpuset(), output_path=tmp_job_dir / "ffmpeg.out"
+                )
             out2 = out2[-20000:]
             log_lines.append("== ffmpeg extract ==")
             log_lines.append(out2)
-            sb_append_log(job_id, "\n".join(log_lines[-80:]) + "\n")
+            flush_log_lines()
 
             if rc2 != 0:
                 tail = "\n".join(out2.splitlines()[-200:])
-                sb_append_log(job_id, "\nERROR: audio extraction failed\n" + tail + "\n")
+                append_log("\nERROR: audio extraction failed\n" + tail + "\n")
                 raise RuntimeError(f"audio extraction failed (rc={rc2})\n{tail}")
 
-            if not wait_for_file(tmp_audio, min_bytes=1024 * 10):
-                sb_append_log(job_id, "\nERROR: wav not ready\n")
-                raise RuntimeError("audio wav not ready")
+        if not _file_ready(tmp_audio, 1024 * 10):
+            append_log("\nERROR: wav not ready\n")
+            raise RuntimeError("audio wav not ready")
 
-            paths["video"].parent.mkdir(parents=True, exist_ok=True)
-            safe_move(merged_video, paths["video"])
-            safe_move(tmp_audio, paths["audio"])
+        paths["video"].parent.mkdir(parents=True, exist_ok=True)
+        if merged_video is not None:
+            await asyncio.to_thread(safe_move, merged_video, paths["video"])
+        await asyncio.to_thread(safe_move, tmp_audio, paths["audio"])
 
-            out_log.write_text("\n".join(log_lines), encoding="utf-8", errors="ignore")
-            sb_append_log(job_id, "\n== DONE ==\n")
+        atomic_write_bytes(out_log, "\n".join(log_lines).encode("utf-8", errors="ignore"))
+        append_log("\n== DONE ==\n")
 
-            urls = _artifact_urls(job_id)
-            video_key = sb_upload_file(job_id, paths["video"], "video.mp4", "video/mp4")
-            audio_key = sb_upload_file(job_id, paths["audio"], "audio.wav", "audio/wav")
-            log_key = sb_upload_file(job_id, paths["log"], "log.txt", "text/plain")
+        uploads = [(paths["audio"], "audio.wav", "audio/wav"), (paths["log"], "log.txt", "text/plain")]
+        if not audio_only:
+            uploads.append((paths["video"], "video.mp4", "video/mp4"))
+        audio_key, log_key, *rest = await asyncio.to_thread(sb_upload_files, job_id, uploads)
+        video_key = rest[0] if rest else None
 
-            # -------------  AUTO-CLIPPER  -------------
-            if ENABLE_AUTO_CLIPPER:
-                auto_clip_video(job_id, paths["video"], log_fn=lambda line: sb_append_log(job_id, line))
-            # ------------------------------------------
-
-            # ---------------------------------------------
-            # Auto-clipper (generate Shorts candidates)
-            # ---------------------------------------------
-            try:
-                max_clip_sec   = 60.0
-                min_clip_sec   = 15.0
-                overlap_margin = 1.0      # seconds, to include full words
-
-                # Rough heuristic: slice the transcript every ~45 s, word-aligned
-                tr = whisper_transcribe(paths["audio"])
-                segs = merge_whisper_segments(tr.get("segments", []))
-                clips: List[Tuple[float, float]] = []
-
-                cursor = 0.0
-                current: List[dict] = []
-                for s in segs:
-                    if s["start"] < cursor:
-                        continue
-                    if not current:
-                        current.append(s)
-                        continue
-                    dur = s["end"] - current[0]["start"]
-                    if dur >= max_clip_sec:
-                        clips.append((current[0]["start"],
-                                    min(current[-1]["end"], current[0]["start"]+max_clip_sec)))
-                        current = [s]
-                    else:
-                        current.append(s)
-
-                # flush tail
-                if current:
-                    dur = current[-1]["end"] - current[0]["start"]
-                    if dur >= min_clip_sec:
-                        clips.append((current[0]["start"], current[-1]["end"]))
-
-                ffmpeg_bin = require_bin("ffmpeg")
-                for c_start, c_end in clips[:20]:          # safety cap
-                    cid = str(uuid.uuid4())
-                    out_mp4 = job_dir(job_id) / "clips" / f"{cid}.mp4"
-                    out_mp4.parent.mkdir(parents=True, exist_ok=True)
-
-                    rc, _ = run_cmd([
-                        ffmpeg_bin, "-y",
-                        "-ss", f"{max(0,c_start-overlap_margin):.3f}",
-                        "-to", f"{c_end+overlap_margin:.3f}",
-                        "-i", str(paths["video"]),
-                        "-c:v", "copy",
-                        "-c:a", "copy",
-                        str(out_mp4)
-                    ])
-                    if rc != 0 or out_mp4.stat().st_size < 500_000:
-                        continue  # skip bad slice
-
-                    key = storage_key(job_id, f"clips/{cid}.mp4")
-                    sb_upload_file(job_id, out_mp4, f"clips/{cid}.mp4", "video/mp4")
-
-                    _supabase.table("clip_segments").insert({
-                        "job_id":          job_id,
-                        "org_id":          job.get("org_id"),
-                        "creator_user_id": job.get("user_id"),
-                        "start_sec":       Decimal(f"{c_start:.3f}"),
-                        "end_sec":         Decimal(f"{c_end:.3f}"),
-                        "storage_key":     key
-                    }).execute()
-            except Exception as ce:
-                sb_append_log(job_id, f"\nAUTO_CLIPPER_ERROR: {ce}\n")
-
-            update_job(job_id, {"storage_video_key": video_key, "storage_audio_key": audio_key, "storage_log_key": log_key})
-            update_job(
-                job_id,
-                {
-                    "status": "done",
-                    "error": None,
-                    "video_path": str(paths["video"].resolve()),
-                    "audio_path": str(paths["audio"].resolve()),
-                    "log_path": str(out_log.resolve()),
-                    **urls,
-                    "updated_at": now_iso(),
-                    "updated_at_ts": time.time(),
-                },
-            )
-        except Exception as e:
-            try:
-                out_log.write_text("\n".join(log_lines) + f"\nERROR: {e}\n", encoding="utf-8", errors="ignore")
-            except Exception:
-                pass
-            sb_append_log(job_id, f"\nERROR: {e}\n")
-            urls = _artifact_urls(job_id)
-            update_job(
-                job_id,
-                {
-                    "status": "error",
-                    "error": str(e),
-                    "video_path": None,
-                    "audio_path": None,
-                    "log_path": str(out_log.resolve()),
-                    **urls,
-                    "updated_at": now_iso(),
-                    "updated_at_ts": time.time(),
-                },
+        # -------------  AUTO-CLIPPER  -------------
+        if ENABLE_AUTO_CLIPPER and not audio_only:
+            await asyncio.to_thread(
+                auto_clip_video, job_id, paths["video"], log_fn=append_log
             )
-        finally:
-            try:
-                shutil.rmtree(tmp_job_dir, ignore_errors=True)
-            except Exception:
-                pass
+        # ------------------------------------------
+
+        # Storage keys and the final state in one update: one registry write, one dirty mark.
+        await asyncio.to_thread(
+            update_job,
+            job_id,
+            {
+                "storage_video_key": video_key,
+                "storage_audio_key": audio_key,
+                "storage_log_key": log_key,
+                "status": "done",
+                "error": None,
+                "video_path": str(paths["video"].resolve()) if not audio_only else None,
+                "audio_path": str(paths["audio"].resolve()),
+                "log_path": str(out_log.resolve()),
+                **updated_stamp(),
+            },
+            job=job,
+        )
+        await asyncio.to_thread(record_url_index, url, job_id, audio_only)
+    except asyncio.CancelledError:
+        # Shutdown cancelled the job (its children are killed by the run_* helpers). Record that
+        # directly, without awaiting, so the final flush does not persist "running" forever.
+        append_log("\nERROR: interrupted: worker shut down\n")
+        update_job(
+            job_id,
+            {"status": "error", "error": "interrupted: worker shut down", **updated_stamp()},
+            job=job,
+        )
+        raise
+    except Exception as e:
+        try:
+            atomic_write_bytes(out_log, ("\n".join(log_lines) + f"\nERROR: {e}\n").encode("utf-8", errors="ignore"))
+        except Exception:
+            pass
+        append_log(f"\nERROR: {e}\n")
+        await asyncio.to_thread(
+            update_job,
+            job_id,
+            {
+                "status": "error",
+                "error": str(e),
+                "video_path": None,
+                "audio_path": None,
+                "log_path": str(out_log.resolve()),
+                **updated_stamp(),
+            },
+            job=job,
+        )
+    finally:
+        if sb_log_buf:
+            await asyncio.to_thread(sb_append_log, job_id, "".join(sb_log_buf))
+        try:
+            await asyncio.to_thread(shutil.rmtree, tmp_job_dir, ignore_errors=True)
+        except Exception:
+            pass
 
 
 # -----------------------------------------------------------------------------
@@ -1978,13 +3314,10 @@ def process_job(job_id: str, url: str) -> None:
 # -----------------------------------------------------------------------------
 
 def ensure_local_from_storage(job_id: str, job: Dict[str, Any], filename: str, local_path: Path, key_field: str) -> bool:
-    try:
-        if local_path.exists() and local_path.stat().st_size > 0:
-            return True
-    except Exception:
-        pass
+    if _file_ready(local_path, 1):
+        return True
     key = job.get(key_field)
-    if key and sb_download_key(key, local_path):
+    if key and sb_download_key_cached(key, local_path):
         return True
     return sb_download_file(job_id, filename, local_path)
 
@@ -1995,11 +3328,8 @@ def dub_storage_keys_from_status(dub_status: Dict[str, Any], lang: str) -> Tuple
 
 
 def ensure_local_dub_from_storage(job_id: str, lang: str, dub_status: Dict[str, Any], kind: str, local_path: Path) -> bool:
-    try:
-        if local_path.exists() and local_path.stat().st_size > 0:
-            return True
-    except Exception:
-        pass
+    if _file_ready(local_path, 1):
+        return True
 
     audio_key, video_key, log_key, srt_key = dub_storage_keys_from_status(dub_status, lang)
 
@@ -2027,22 +3357,7 @@ def load_job_for_artifacts(job_id: str) -> Dict[str, Any]:
         return local
     sb = sb_get_job(job_id)
     if sb:
-        job = {
-            "id": str(sb.get("id")),
-            "url": sb.get("url"),
-            "status": sb.get("status"),
-            "error": sb.get("error"),
-            "video_url": sb.get("video_url"),
-            "audio_url": sb.get("audio_url"),
-            "log_url": sb.get("log_url"),
-            "created_at": sb.get("created_at"),
-            "updated_at": sb.get("updated_at"),
-            "storage_video_key": sb.get("storage_video_key"),
-            "storage_audio_key": sb.get("storage_audio_key"),
-            "storage_log_key": sb.get("storage_log_key"),
-            "dub_status": sb.get("dub_status") or {},
-            "dub_log_text": sb.get("dub_log_text") or {},
-        }
+        job = _job_from_sb_row(sb)
         if local:
             job.update(local)
         save_job_local(job_id, job)
@@ -2058,15 +3373,21 @@ def ensure_base_artifacts_local(job_id: str, job: Dict[str, Any]) -> Tuple[Path,
     video_p = Path(job["video_path"]) if job.get("video_path") else paths["video"]
     audio_p = Path(job["audio_path"]) if job.get("audio_path") else paths["audio"]
 
-    if (not video_p.exists()) or video_p.stat().st_size < 10_000:
-        key = job.get("storage_video_key") or storage_key(job_id, "video.mp4")
-        if not sb_download_key(key, video_p):
-            raise RuntimeError("base video missing locally and not found in storage")
-
-    if (not audio_p.exists()) or audio_p.stat().st_size < 2_000:
-        key = job.get("storage_audio_key") or storage_key(job_id, "audio.wav")
-        if not sb_download_key(key, audio_p):
-            raise RuntimeError("base audio missing locally and not found in storage")
+    need_video = not _file_ready(video_p, 10_000)
+    need_audio = not _file_ready(audio_p, 2_000)
+    if need_video or need_audio:
+        # Both may be missing on a fresh instance: fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            video_ok = ex.submit(
+                sb_download_key_cached, job.get("storage_video_key") or storage_key(job_id, "video.mp4"), video_p
+            ) if need_video else None
+            audio_ok = ex.submit(
+                sb_download_key_cached, job.get("storage_audio_key") or storage_key(job_id, "audio.wav"), audio_p
+            ) if need_audio else None
+            if video_ok is not None and not video_ok.result():
+                raise RuntimeError("base video missing locally and not found in storage")
+            if audio_ok is not None and not audio_ok.result():
+                raise RuntimeError("base audio missing locally and not found in storage")
 
     patch: Dict[str, Any] = {}
     if not job.get("video_path"):
@@ -2074,8 +3395,7 @@ def ensure_base_artifacts_local(job_id: str, job: Dict[str, Any]) -> Tuple[Path,
     if not job.get("audio_path"):
         patch["audio_path"] = str(audio_p.resolve())
     if patch:
-        patch["updated_at"] = now_iso()
-        patch["updated_at_ts"] = time.time()
+        patch.update(updated_stamp())
         update_job(job_id, patch)
 
     return video_p, audio_p
@@ -2149,6 +3469,32 @@ def auto_clip_video(job_id: str, video_in: Path, log_fn=print) -> None:
 # Dubbing
 # -----------------------------------------------------------------------------
 
+def _dub_pool_ready() -> None:
+    """No-op submitted at startup so each pool child has already imported this module."""
+
+
+def local_dub_outputs_ready(job_id: str, lang: str) -> bool:
+    return (
+        _file_ready(dub_audio_path(job_id, lang), 2049)
+        and _file_ready(dub_video_path(job_id, lang), 10_001)
+        and _file_ready(dub_captions_path(job_id, lang), 1)
+    )
+
+
+def local_dub_done(job_id: str, lang: str) -> bool:
+    """The local status file says done (the outputs were uploaded and recorded by that run)."""
+    try:
+        return json_loads(dub_status_path(job_id, lang).read_bytes()).get("status") == "done"
+    except Exception:
+        return False
+
+
+def run_dub_job(job_id: str, lang: str, caption_style: str = "clean") -> None:
+    """Dub entry point for the WORKER_MODE=subprocess pool: persist before the task returns."""
+    process_dub(job_id, lang, caption_style)
+    flush_jobs()
+
+
 def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
     lang = (lang or "").strip().lower()
     if lang not in SUPPORTED_DUB_LANGS:
@@ -2162,10 +3508,13 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
         local_log_path = dub_log_path(job_id, lang)
         srt_path = dub_captions_path(job_id, lang)
 
+        # One line-buffered handle for the whole run: each line is still on disk for get_dub_log
+        # (and the log upload) as soon as it is written, without an open/close per line.
+        log_fp = open(local_log_path, "a", encoding="utf-8", buffering=1)
+
         def log(line: str) -> None:
             line = line.rstrip()
-            with open(local_log_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            log_fp.write(line + "\n")
             sb_append_dub_log(job_id, lang, line)
 
         def heartbeat() -> None:
@@ -2183,40 +3532,51 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
             log(f"whisper_model={WHISPER_MODEL} translate={TRANSLATE_PROVIDER}")
             heartbeat()
 
-            job = load_job_for_artifacts(job_id)
-            if job.get("status") != "done":
-                raise RuntimeError(f"base job not done (status={job.get('status')})")
-
-            video_in, audio_in = ensure_base_artifacts_local(job_id, job)
-
             out_audio = dub_audio_path(job_id, lang)
             out_video = dub_video_path(job_id, lang)
 
-            # Gender selection
-            mode = (os.getenv("VOICE_GENDER_MODE") or "auto").strip().lower()
-            speaker_gender = "unknown"
-            speaker_f0 = None
-            if mode in {"male", "female"}:
-                speaker_gender = mode
+            # Checked before anything else: a re-requested dub touches neither the base artifacts
+            # (possibly a storage download) nor any model.
+            if local_dub_outputs_ready(job_id, lang):
+                log("cached=true (local dub exists)")
             else:
-                speaker_f0 = estimate_median_f0(audio_in)
-                speaker_gender = infer_gender_from_f0(speaker_f0)
+                job = load_job_for_artifacts(job_id)
+                if job.get("status") != "done":
+                    raise RuntimeError(f"base job not done (status={job.get('status')})")
+
+                video_in, audio_in = ensure_base_artifacts_local(job_id, job)
+
+                # Gender selection
+                mode = (os.getenv("VOICE_GENDER_MODE") or "auto").strip().lower()
+                speaker_gender = "unknown"
+                speaker_f0 = None
+                # Decoded once and shared by F0 estimation and Whisper.
+                samples: Optional[np.ndarray] = None
+                # F0 and transcript of an earlier dub of this job (another language, or a retry).
+                analysis = load_dub_analysis(job_id, audio_in)
+                if mode in {"male", "female"}:
+                    speaker_gender = mode
+                else:
+                    if "speaker_f0" in analysis:
+                        speaker_f0 = analysis["speaker_f0"]
+                    else:
+                        samples = load_pcm16k_mono(audio_in)
+                        speaker_f0 = analysis["speaker_f0"] = estimate_median_f0(samples)
+                        save_dub_analysis(job_id, audio_in, analysis)
+                    speaker_gender = infer_gender_from_f0(speaker_f0)
 
-            log(f"speaker_f0_hz={speaker_f0} speaker_gender={speaker_gender}")
-            heartbeat()
+                log(f"speaker_f0_hz={speaker_f0} speaker_gender={speaker_gender}")
+                heartbeat()
 
-            # Cache hit
-            if (
-                out_audio.exists()
-                and out_video.exists()
-                and srt_path.exists()
-                and out_audio.stat().st_size > 2048
-                and out_video.stat().st_size > 10_000
-            ):
-                log("cached=true (local dub exists)")
-            else:
-                log("transcribing...")
-                tr = whisper_transcribe(audio_in)
+                tr = analysis.get("transcript")
+                if tr is not None:
+                    log("transcript=cached (shared with earlier dubs of this job)")
+                else:
+                    log("transcribing...")
+                    if samples is None:
+                        samples = load_pcm16k_mono(audio_in)
+                    tr = analysis["transcript"] = whisper_transcribe(samples)
+                    save_dub_analysis(job_id, audio_in, analysis)
                 src_text = tr.get("text", "") or ""
                 segs = tr.get("segments", []) or []
                 log(f"transcribed_chars={len(src_text)} segments={len(segs)}")
@@ -2257,6 +3617,9 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
 
                     provider = (os.getenv("TTS_PROVIDER") or "auto").strip().lower()
 
+                    seg_texts = [(s.get("text") or "").strip() for s in merged]
+                    seg_trs = seg_texts if lang == "en" else translate_texts(seg_texts, lang)
+
                     for idx, s in enumerate(merged):
                         start = float(s.get("start", 0.0))
                         end = float(s.get("end", 0.0))
@@ -2275,8 +3638,7 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
                             make_silence_wav(gap, sil)
                             timeline_parts.append(sil)
 
-                        seg_tr = seg_text if lang == "en" else translate_text(seg_text, lang)
-                        seg_tr = _truncate((seg_tr or "").strip(), 260)
+                        seg_tr = _truncate((seg_trs[idx] or "").strip(), 260)
                         if not seg_tr:
                             seg_tr = seg_text
 
@@ -2300,6 +3662,14 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
                                 tts_espeak(seg_tr, lang, seg_raw)
                                 raw_d = wav_duration_seconds(seg_raw)
                                 log(f"seg={idx} espeak raw_dur={raw_d:.2f}s target={dur:.2f}s")
+                        elif provider == "piper":
+                            try:
+                                tts_piper(seg_tr, lang, seg_raw)
+                            except Exception as e:
+                                log(f"seg={idx} piper_failed err={e} (fallback espeak)")
+                                tts_espeak(seg_tr, lang, seg_raw)
+                            raw_d = wav_duration_seconds(seg_raw)
+                            log(f"seg={idx} piper raw_dur={raw_d:.2f}s target={dur:.2f}s")
                         else:
                             tts_espeak(seg_tr, lang, seg_raw)
                             raw_d = wav_duration_seconds(seg_raw)
@@ -2329,7 +3699,8 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
 
                     log("muxing_audio_into_video...")
                     tmp_video = dd / "video_with_audio.mp4"
-                    mux_audio_into_video(video_in, out_audio, tmp_video, log_fn=log)
+                    # Without captions the mux output is served as-is: make it stream-friendly.
+                    mux_audio_into_video(video_in, out_audio, tmp_video, log_fn=log, faststart=not subs)
 
                     if subs:
                         log(f"burning_captions style={caption_style} ...")
@@ -2337,7 +3708,7 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
                     else:
                         tmp_video.replace(out_video)
 
-                    if not out_video.exists() or out_video.stat().st_size < 10_000:
+                    if not _file_ready(out_video, 10_000):
                         raise RuntimeError("dub video not generated")
 
                     log("dub_files=generated (timed)")
@@ -2354,7 +3725,7 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
                         raise RuntimeError("translation empty")
 
                     tts_speak(translated, lang, out_audio, log_fn=log, gender=speaker_gender)
-                    if not out_audio.exists() or out_audio.stat().st_size < 2048:
+                    if not _file_ready(out_audio, 2048):
                         raise RuntimeError("dub audio not generated")
 
                     normalize_audio(out_audio, log_fn=log)
@@ -2366,16 +3737,21 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
                     log(f"burning_captions style={caption_style} ...")
                     burn_captions(tmp_video, srt_path, out_video, caption_style, lang=lang, log_fn=log)
 
-                    if not out_video.exists() or out_video.stat().st_size < 10_000:
+                    if not _file_ready(out_video, 10_000):
                         raise RuntimeError("dub video not generated")
 
                     log("dub_files=generated (fallback)")
 
             log("uploading_to_storage...")
-            audio_key = sb_upload_file(job_id, out_audio, f"dubs/{lang}/audio.wav", "audio/wav")
-            video_key = sb_upload_file(job_id, out_video, f"dubs/{lang}/video.mp4", "video/mp4")
-            log_key = sb_upload_file(job_id, local_log_path, f"dubs/{lang}/log.txt", "text/plain")
-            srt_key = sb_upload_file(job_id, srt_path, f"dubs/{lang}/captions.srt", "text/plain")
+            audio_key, video_key, log_key, srt_key = sb_upload_files(
+                job_id,
+                [
+                    (out_audio, f"dubs/{lang}/audio.wav", "audio/wav"),
+                    (out_video, f"dubs/{lang}/video.mp4", "video/mp4"),
+                    (local_log_path, f"dubs/{lang}/log.txt", "text/plain"),
+                    (srt_path, f"dubs/{lang}/captions.srt", "text/plain"),
+                ],
+            )
 
             log("uploaded_to_storage=true")
 
@@ -2386,21 +3762,88 @@ def process_dub(job_id: str, lang: str, caption_style: str = "clean") -> None:
         except Exception as e:
             error_msg = f"ERROR: {e}"
             try:
-                with open(local_log_path, "a", encoding="utf-8") as f:
-                    f.write(error_msg + "\n")
+                log_fp.write(error_msg + "\n")
             except Exception:
                 pass
             sb_upsert_dub_status(job_id, lang, "error", error=str(e))
             write_dub_status(job_id, lang, "error", str(e))
             print(error_msg)
+        finally:
+            log_fp.close()
 
 
 # -----------------------------------------------------------------------------
 # API Schemas & Routes
 # -----------------------------------------------------------------------------
 
+class ArtifactResponse(FileResponse):
+    """
+    FileResponse for large media. Starlette reads 64 KiB per chunk by default;
+    bigger chunks cut syscalls and event-loop round-trips for multi-hundred-MB mp4s.
+    Range requests (206, Accept-Ranges, Content-Length) are handled by FileResponse itself.
+    """
+
+    chunk_size = ARTIFACT_CHUNK_SIZE
+
+    def __init__(self, path: str, *args: Any, stat_result: Optional[os.stat_result] = None, **kwargs: Any) -> None:
+        # Stat up front in the (sync) route's worker thread: with stat_result set, FileResponse
+        # builds its headers here and skips the extra threadpool hop for os.stat when sending.
+        if stat_result is None:
+            stat_result = os.stat(path)
+        super().__init__(path, *args, stat_result=stat_result, **kwargs)
+
+
+def stat_artifact(path: Path, min_bytes: int = 1) -> Optional[os.stat_result]:
+    """One stat(): the result when `path` is a regular file of at least `min_bytes`, else None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) and st.st_size >= min_bytes else None
+
+
+def artifact_response(
+    path: Path,
+    media_type: str,
+    filename: str,
+    if_none_match: Optional[str],
+    stat_result: Optional[os.stat_result] = None,
+) -> Response:
+    """ArtifactResponse, or a bodiless 304 when the client already holds this version (FileResponse's ETag)."""
+    resp = ArtifactResponse(path=str(path), media_type=media_type, filename=filename, stat_result=stat_result)
+    etag = resp.headers.get("etag")
+    if if_none_match and etag:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Last-Modified": resp.headers["last-modified"], "Accept-Ranges": "bytes"},
+            )
+    if XACCEL_PREFIX:
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(_data_root())
+        except ValueError:
+            return resp  # outside DATA_DIR: nginx cannot map it, serve it ourselves
+        return Response(
+            headers={
+                "X-Accel-Redirect": f"{XACCEL_PREFIX}/{urllib.parse.quote(rel.as_posix())}",
+                "Content-Type": media_type,
+                "Content-Disposition": resp.headers["content-disposition"],
+                "ETag": etag,
+                "Last-Modified": resp.headers["last-modified"],
+            },
+        )
+    return resp
+
+
+@lru_cache(maxsize=1)
+def _data_root() -> Path:
+    return DATA_DIR.resolve()
+
+
 class CreateJobBody(BaseModel):
     url: HttpUrl
+    audio_only: bool = Field(default=False, alias="audioOnly")
 
 
 class DubBody(BaseModel):
@@ -2440,7 +3883,7 @@ def youtube_upload(body: YouTubeUploadBody, authorization: str = Header(default=
 
         mp4_path = dub_video_path(job_id, lang)
         ok = ensure_local_dub_from_storage(job_id, lang, dub_status, "video", mp4_path)
-        if (not ok) or (not mp4_path.exists()) or mp4_path.stat().st_size < 10_000:
+        if (not ok) or not _file_ready(mp4_path, 10_000):
             raise HTTPException(status_code=404, detail="Dub video not found. Generate dub first.")
 
         refresh_token = sb_get_youtube_refresh_token(uid)
@@ -2472,29 +3915,46 @@ def youtube_upload(body: YouTubeUploadBody, authorization: str = Header(default=
         return {"ok": True, "videoId": video_id, "url": youtube_url, "privacyStatus": privacy}
 
 @app.get("/health")
-def health():
+async def health():
     return {"ok": True}
 
 
 @app.get("/", response_class=PlainTextResponse)
-def root():
+async def root():
     return "ClipLingua Worker OK (Timed Dub v0.9.1)"
 
 
+@app.on_event("startup")
+async def _build_routes_index() -> None:
+    # The route table is fixed once the app starts: build the listing once, not per request.
+    app.state.routes_index = {
+        "routes": [
+            {"path": r.path, "methods": sorted(getattr(r, "methods", None) or []), "name": r.name}
+            for r in app.router.routes
+        ]
+    }
+
+
+@app.get("/routes")
+async def routes():
+    return app.state.routes_index
+
+
 @app.head("/")
-def head_root():
+async def head_root():
     return Response(status_code=200)
 
 
 @app.get("/debug/binaries")
-def debug_binaries():
+async def debug_binaries():
     return {
         "python": sys.version,
-        "yt_dlp": shutil.which("yt-dlp"),
-        "ffmpeg": shutil.which("ffmpeg"),
-        "ffprobe": shutil.which("ffprobe"),
-        "node": shutil.which("node"),
-        "espeak_ng": shutil.which("espeak-ng"),
+        "yt_dlp": which_cached("yt-dlp"),
+        "ffmpeg": which_cached("ffmpeg"),
+        "ffprobe": which_cached("ffprobe"),
+        "node": which_cached("node"),
+        "espeak_ng": which_cached("espeak-ng"),
+        "aria2c": which_cached("aria2c"),
         "DATA_DIR": str(DATA_DIR.resolve()),
         "TMP_DIR": str(TMP_DIR.resolve()),
         "JOB_STORE_DIR": str(JOB_STORE_DIR.resolve()),
@@ -2503,25 +3963,47 @@ def debug_binaries():
         "cookies_path": (os.getenv("YTDLP_COOKIES_PATH") or "").strip() or None,
         "supabase_enabled": bool(_supabase),
         "WHISPER_MODEL": WHISPER_MODEL,
+        "WHISPER_COMPUTE_TYPE": WHISPER_COMPUTE_TYPE,
+        "WHISPER_DEVICE": WHISPER_DEVICE,
+        "WHISPER_THREADS": WHISPER_THREADS,
+        "WHISPER_BEAM_SIZE": WHISPER_BEAM_SIZE,
+        "WHISPER_VAD": WHISPER_VAD,
+        "WHISPER_LANGUAGE": WHISPER_LANGUAGE,
         "NLLB_MODEL": NLLB_MODEL,
+        "NLLB_CT2_DIR": NLLB_CT2_DIR or None,
+        "NLLB_BATCH_SIZE": NLLB_BATCH_SIZE,
+        "NLLB_BEAMS": NLLB_BEAMS,
+        "NLLB_QUANTIZE": NLLB_QUANTIZE,
+        "NLLB_BF16": NLLB_BF16,
+        "TORCH_THREADS": TORCH_THREADS,
         "DISABLE_XTTS": DISABLE_XTTS,
+        "WARMUP_MODELS": sorted(WARMUP_MODELS),
+        "WORKER_MODE": WORKER_MODE,
+        "CLIPLINGUA_WORKERS": CLIPLINGUA_WORKERS,
         "TRANSLATE_PROVIDER": TRANSLATE_PROVIDER,
         "ENABLE_LOCAL_NLLB": ENABLE_LOCAL_NLLB,
         "MAX_TRANSCRIPT_CHARS": MAX_TRANSCRIPT_CHARS,
         "DUB_STALE_SECONDS": DUB_STALE_SECONDS,
+        "ENABLE_URL_CACHE": ENABLE_URL_CACHE,
         "BUILD_TAG": BUILD_TAG,
+        "XACCEL_PREFIX": XACCEL_PREFIX or None,
         "ENABLE_AUDIO_NORMALIZATION": ENABLE_AUDIO_NORMALIZATION,
         "ENABLE_SENTENCE_SPLITTING": ENABLE_SENTENCE_SPLITTING,
         "ENABLE_TIMED_DUB": ENABLE_TIMED_DUB,
         "MAX_DUB_SEGMENTS": MAX_DUB_SEGMENTS,
         "EDGE_TTS_VOLUME": EDGE_TTS_VOLUME,
         "EDGE_TTS_PITCH": EDGE_TTS_PITCH,
+        "TTS_PROVIDER": (os.getenv("TTS_PROVIDER") or "auto").strip().lower(),
+        "piper_installed": importlib.util.find_spec("piper") is not None,
+        "PIPER_VOICES_DIR": str(PIPER_VOICES_DIR),
     }
 
 
-@app.post("/jobs")
-def create_job(body: CreateJobBody):
+def register_job(body: CreateJobBody) -> Tuple[str, bool]:
+    """Create the job record. Returns (job_id, needs_run); needs_run is False on a URL cache hit."""
     job_id = str(uuid.uuid4())
+    now_ts = time.time()
+    created_at = iso_from_ts(now_ts)
     paths = _job_artifact_paths(job_id)
     paths["job_dir"].mkdir(parents=True, exist_ok=True)
     payload: Dict[str, Any] = {
@@ -2533,71 +4015,214 @@ def create_job(body: CreateJobBody):
         "audio_path": None,
         "log_path": str(paths["log"].resolve()),
         "runner_log_path": str(paths["runner_log"].resolve()),
-        **_artifact_urls(job_id),
-        "created_at": now_iso(),
-        "updated_at": now_iso(),
-        "updated_at_ts": time.time(),
+        **_artifact_urls(job_id, body.audio_only),
+        "created_at": created_at,
+        "updated_at": created_at,
+        "updated_at_ts": now_ts,
         "data_dir": str(paths["job_dir"].resolve()),
+        "audio_only": body.audio_only,
         "dub_status": {},
         "dub_log_text": {},
     }
+    cached = link_cached_artifacts(job_id, str(body.url), body.audio_only) if ENABLE_URL_CACHE else None
+    if cached:
+        payload.update(cached)
+        save_job_local(job_id, payload)
+        sb_upsert_job(job_id, payload)
+        sb_append_log(job_id, f"url_cache=hit reused_from={cached['reused_from']}\n")
+        return job_id, False
+
     save_job_local(job_id, payload)
     sb_upsert_job(job_id, payload)
-    sb_append_log(job_id, f"spawned job runner at {now_iso()} url={body.url}\n")
-    threading.Thread(target=process_job, args=(job_id, str(body.url)), daemon=True).start()
+    sb_append_log(job_id, f"spawned job runner at {created_at} url={body.url}\n")
+    return job_id, True
+
+
+@app.post("/jobs")
+async def create_job(body: CreateJobBody):
+    job_id, needs_run = await asyncio.to_thread(register_job, body)
+    if needs_run:
+        JOB_QUEUE.put_nowait((job_id, str(body.url), body.audio_only))
     return {"jobId": job_id}
 
 
+# Short-lived memo of /jobs/{id} bodies: several tabs/clients polling the same job within
+# JOB_POLL_CACHE_SECONDS share one load_job (and one Supabase read).
+JOB_POLL_CACHE_SECONDS = float(os.getenv("JOB_POLL_CACHE_SECONDS", "0.5"))
+_JOB_POLL_CACHE: Dict[str, Tuple[float, bytes, str]] = {}
+# Writers (event loop and threadpool) serialize on this; lookups are single dict.get calls.
+_JOB_POLL_CACHE_LOCK = threading.Lock()
+
+
+def _job_poll_hit(job_id: str) -> Optional[Tuple[bytes, str]]:
+    hit = _JOB_POLL_CACHE.get(job_id)
+    if hit and time.monotonic() - hit[0] < JOB_POLL_CACHE_SECONDS:
+        return hit[1], hit[2]
+    return None
+
+
+def _job_poll_body(job_id: str) -> Tuple[bytes, str]:
+    hit = _job_poll_hit(job_id)
+    if hit:
+        return hit
+    now = time.monotonic()
+    body = json_dumps_bytes(load_job(job_id))
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    with _JOB_POLL_CACHE_LOCK:
+        if len(_JOB_POLL_CACHE) >= JOB_CACHE_MAX:
+            for k in [k for k, v in _JOB_POLL_CACHE.items() if now - v[0] >= JOB_POLL_CACHE_SECONDS]:
+                _JOB_POLL_CACHE.pop(k, None)
+        _JOB_POLL_CACHE[job_id] = (now, body, etag)
+    return body, etag
+
+
 @app.get("/jobs/{job_id}")
-def get_job(job_id: str):
-    return load_job(job_id)
+async def get_job(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    # A fresh memo entry is answered on the event loop; only a miss (registry, jobs.db or
+    # Supabase read) takes the threadpool hop.
+    hit = _job_poll_hit(job_id)
+    body, etag = hit if hit else await asyncio.to_thread(_job_poll_body, job_id)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in {t.strip().removeprefix("W/") for t in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def text_file_response(p: Path) -> FileResponse:
+    # FileResponse streams the file in chunks with async file I/O instead of
+    # reading it whole inside the threadpool worker.
+    return FileResponse(path=str(p), media_type="text/plain")
+
+
+def parse_tail(tail: Optional[str]) -> Optional[int]:
+    """`?tail=` as a byte count: `65536`, `64k` or `1m`. None means the whole log."""
+    if not tail:
+        return None
+    t = tail.strip().lower()
+    mult = 1
+    if t.endswith("k"):
+        mult, t = 1024, t[:-1]
+    elif t.endswith("m"):
+        mult, t = 1024 * 1024, t[:-1]
+    try:
+        n = int(t) * mult
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid tail")
+    if n <= 0:
+        raise HTTPException(status_code=400, detail="invalid tail")
+    return n
+
+
+def log_file_response(p: Path, tail: Optional[int]) -> Response:
+    if tail is None:
+        return text_file_response(p)
+    # Only the last `tail` bytes are read; a split leading character is dropped by errors="ignore".
+    return PlainTextResponse(read_tail_bytes(p, tail).decode("utf-8", errors="ignore"))
+
+
+def log_text_response(text: str, tail: Optional[int]) -> str:
+    return text if tail is None else text[-tail:]
+
+
+@app.get("/jobs/{job_id}/status", response_class=PlainTextResponse)
+def get_job_status(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    try:
+        with open(job_status_path(job_id), "rb") as f:
+            st = os.fstat(f.fileno())
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            headers = {
+                "ETag": etag,
+                "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+                "Cache-Control": "no-cache",
+            }
+            if if_none_match == etag:
+                return Response(status_code=304, headers=headers)
+            status = f.readline().decode("utf-8", errors="ignore").strip()
+        return PlainTextResponse(status, headers=headers)
+    except FileNotFoundError:
+        return PlainTextResponse(str(load_job(job_id).get("status") or ""))
 
 
 @app.get("/jobs/{job_id}/log", response_class=PlainTextResponse)
-def get_job_log(job_id: str):
+def get_job_log(job_id: str, tail: Optional[str] = None):
+    tail_bytes = parse_tail(tail)
     job = load_job(job_id)
     paths = _job_artifact_paths(job_id)
     lp = Path(job.get("log_path") or paths["log"])
+    if job.get("status") in {"queued", "running"}:
+        # The Supabase log is written once the job ends; live progress is only in the runner log.
+        progress = runner_log_tail(job_id)
+        if progress is not None:
+            return log_text_response(progress, tail_bytes)
     sb = sb_get_log(job_id)
     if sb is not None:
-        return sb
+        return log_text_response(sb, tail_bytes)
     if lp.exists():
-        return lp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(lp, tail_bytes)
     ok = ensure_local_from_storage(job_id, job, "log.txt", lp, "storage_log_key")
     if ok:
-        return lp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(lp, tail_bytes)
     rlp = paths["runner_log"]
     if rlp.exists():
-        return rlp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(rlp, tail_bytes)
+    progress = runner_log_tail(job_id)
+    if progress is not None:
+        return log_text_response(progress, tail_bytes)
     raise HTTPException(status_code=404, detail="log not ready")
 
 
 @app.get("/jobs/{job_id}/audio")
-def get_job_audio(job_id: str):
-    job = load_job(job_id)
+def get_job_audio(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    job = load_finished_job(job_id)
     paths = _job_artifact_paths(job_id)
     ap = job.get("audio_path")
     local_p = Path(ap) if ap else paths["audio"]
-    ok = ensure_local_from_storage(job_id, job, "audio.wav", local_p, "storage_audio_key")
-    if not ok:
-        raise HTTPException(status_code=404, detail="audio not ready")
+    st = stat_artifact(local_p)
+    if st is None:
+        if ensure_local_from_storage(job_id, job, "audio.wav", local_p, "storage_audio_key"):
+            st = stat_artifact(local_p)
+        if st is None:
+            raise HTTPException(status_code=404, detail="audio not ready")
     if not job.get("audio_path"):
-        update_job(job_id, {"audio_path": str(local_p.resolve()), "updated_at": now_iso(), "updated_at_ts": time.time()})
-    return FileResponse(path=str(local_p), media_type="audio/wav", filename=f"{job_id}.wav")
+        update_job(job_id, {"audio_path": str(local_p.resolve()), **updated_stamp()})
+    return artifact_response(local_p, "audio/wav", f"{job_id}.wav", if_none_match, st)
 
 
 @app.get("/jobs/{job_id}/video")
-def get_job_video(job_id: str):
-    job = load_job(job_id)
+def get_job_video(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    job = load_finished_job(job_id)
     paths = _job_artifact_paths(job_id)
     vp = job.get("video_path")
     local_p = Path(vp) if vp else paths["video"]
-    ok = ensure_local_from_storage(job_id, job, "video.mp4", local_p, "storage_video_key")
-    if not ok:
-        raise HTTPException(status_code=404, detail="video not ready")
+    st = stat_artifact(local_p)
+    if st is None:
+        if ensure_local_from_storage(job_id, job, "video.mp4", local_p, "storage_video_key"):
+            st = stat_artifact(local_p)
+        if st is None:
+            raise HTTPException(status_code=404, detail="video not ready")
     if not job.get("video_path"):
-        update_job(job_id, {"video_path": str(local_p.resolve()), "updated_at": now_iso(), "updated_at_ts": time.time()})
-    return FileResponse(path=str(local_p), media_type="video/mp4", filename=f"{job_id}.mp4")
+        update_job(job_id, {"video_path": str(local_p.resolve()), **updated_stamp()})
+    return artifact_response(local_p, "video/mp4", f"{job_id}.mp4", if_none_match, st)
+
+
+# HEAD probes: a stat of the canonical artifact path answers them (FileResponse sends headers
+# only for HEAD). Only when the file is not there do they take the GET path (job record, storage).
+@app.head("/jobs/{job_id}/audio")
+def head_job_audio(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    p = _job_artifact_paths(job_id)["audio"]
+    st = stat_artifact(p)
+    if st is None:
+        return get_job_audio(job_id, if_none_match)
+    return artifact_response(p, "audio/wav", f"{job_id}.wav", if_none_match, st)
+
+
+@app.head("/jobs/{job_id}/video")
+def head_job_video(job_id: str, if_none_match: Optional[str] = Header(default=None)):
+    p = _job_artifact_paths(job_id)["video"]
+    st = stat_artifact(p)
+    if st is None:
+        return get_job_video(job_id, if_none_match)
+    return artifact_response(p, "video/mp4", f"{job_id}.mp4", if_none_match, st)
 
 
 @app.post("/jobs/{job_id}/dub")
@@ -2609,9 +4234,13 @@ def dub_job(job_id: str, body: DubBody):
         raise HTTPException(status_code=400, detail="unsupported lang (use hi/en/es)")
 
     _ = load_job_for_artifacts(job_id)
-    write_dub_status(job_id, lang, "queued")
+    if not (local_dub_done(job_id, lang) and local_dub_outputs_ready(job_id, lang)):
+        write_dub_status(job_id, lang, "queued")
 
-    threading.Thread(target=process_dub, args=(job_id, lang, caption_style), daemon=True).start()
+        if WORKER_MODE == "subprocess":
+            app.state.dub_pool.submit(run_dub_job, job_id, lang, caption_style)
+        else:
+            DUB_EXECUTOR.submit(process_dub, job_id, lang, caption_style)
 
     return {
         "ok": True,
@@ -2656,34 +4285,37 @@ def get_dub_status(job_id: str, lang: str):
                         }
             return {"job_id": job_id, "lang": lang, **st}
 
-    p = dub_status_path(job_id, lang)
-    if p.exists():
-        return json.loads(p.read_text(encoding="utf-8"))
-    return {"job_id": job_id, "lang": lang, "status": "not_started"}
+    # The status file is already the JSON body (written by json_dumps_bytes): pass the bytes
+    # through instead of parsing and re-serializing them.
+    try:
+        return Response(content=dub_status_path(job_id, lang).read_bytes(), media_type="application/json")
+    except FileNotFoundError:
+        return {"job_id": job_id, "lang": lang, "status": "not_started"}
 
 
 @app.get("/jobs/{job_id}/dubs/{lang}/log", response_class=PlainTextResponse)
-def get_dub_log(job_id: str, lang: str):
+def get_dub_log(job_id: str, lang: str, tail: Optional[str] = None):
     lang = (lang or "").strip().lower()
     if lang not in SUPPORTED_DUB_LANGS:
         raise HTTPException(status_code=400, detail="unsupported lang")
+    tail_bytes = parse_tail(tail)
 
     sb_txt = sb_get_dub_log_text(job_id, lang)
     if sb_txt:
-        return sb_txt
+        return log_text_response(sb_txt, tail_bytes)
 
     lp = dub_log_path(job_id, lang)
     if lp.exists():
-        return lp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(lp, tail_bytes)
 
     dub_status = sb_get_dub_status_map(job_id)
     ok = ensure_local_dub_from_storage(job_id, lang, dub_status, "log", lp)
     if ok and lp.exists():
-        return lp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(lp, tail_bytes)
 
     rp = dub_runner_log_path(job_id, lang)
     if rp.exists():
-        return rp.read_text(encoding="utf-8", errors="ignore")
+        return log_file_response(rp, tail_bytes)
     raise HTTPException(status_code=404, detail="log not ready")
 
 
@@ -2693,7 +4325,7 @@ def get_dub_captions(job_id: str, lang: str):
     if lang not in SUPPORTED_DUB_LANGS:
         raise HTTPException(status_code=400, detail="unsupported lang")
     p = dub_captions_path(job_id, lang)
-    if not p.exists() or p.stat().st_size < 50:
+    if not _file_ready(p, 50):
         dub_status = sb_get_dub_status_map(job_id)
         if not ensure_local_dub_from_storage(job_id, lang, dub_status, "captions", p):
             raise HTTPException(status_code=404, detail="dub captions not ready")
@@ -2701,26 +4333,50 @@ def get_dub_captions(job_id: str, lang: str):
 
 
 @app.get("/jobs/{job_id}/dubs/{lang}/audio")
-def get_dub_audio(job_id: str, lang: str):
+def get_dub_audio(job_id: str, lang: str, if_none_match: Optional[str] = Header(default=None)):
     lang = (lang or "").strip().lower()
     if lang not in SUPPORTED_DUB_LANGS:
         raise HTTPException(status_code=400, detail="unsupported lang")
     p = dub_audio_path(job_id, lang)
-    if not p.exists() or p.stat().st_size < 2048:
+    st = stat_artifact(p, 2048)
+    if st is None:
         dub_status = sb_get_dub_status_map(job_id)
-        if not ensure_local_dub_from_storage(job_id, lang, dub_status, "audio", p):
+        if ensure_local_dub_from_storage(job_id, lang, dub_status, "audio", p):
+            st = stat_artifact(p)
+        if st is None:
             raise HTTPException(status_code=404, detail="dub audio not ready")
-    return FileResponse(path=str(p), media_type="audio/wav", filename=f"{job_id}_{lang}.wav")
+    return artifact_response(p, "audio/wav", f"{job_id}_{lang}.wav", if_none_match, st)
 
 
 @app.get("/jobs/{job_id}/dubs/{lang}/video")
-def get_dub_video(job_id: str, lang: str):
+def get_dub_video(job_id: str, lang: str, if_none_match: Optional[str] = Header(default=None)):
     lang = (lang or "").strip().lower()
     if lang not in SUPPORTED_DUB_LANGS:
         raise HTTPException(status_code=400, detail="unsupported lang")
     p = dub_video_path(job_id, lang)
-    if not p.exists() or p.stat().st_size < 10_000:
+    st = stat_artifact(p, 10_000)
+    if st is None:
         dub_status = sb_get_dub_status_map(job_id)
-        if not ensure_local_dub_from_storage(job_id, lang, dub_status, "video", p):
+        if ensure_local_dub_from_storage(job_id, lang, dub_status, "video", p):
+            st = stat_artifact(p)
+        if st is None:
             raise HTTPException(status_code=404, detail="dub video not ready")
-    return FileResponse(path=str(p), media_type="video/mp4", filename=f"{job_id}_{lang}.mp4")
+    return artifact_response(p, "video/mp4", f"{job_id}_{lang}.mp4", if_none_match, st)
+
+
+@app.head("/jobs/{job_id}/dubs/{lang}/audio")
+def head_dub_audio(job_id: str, lang: str, if_none_match: Optional[str] = Header(default=None)):
+    lang = (lang or "").strip().lower()
+    st = stat_artifact(dub_audio_path(job_id, lang), 2048) if lang in SUPPORTED_DUB_LANGS else None
+    if st is None:
+        return get_dub_audio(job_id, lang, if_none_match)
+    return artifact_response(dub_audio_path(job_id, lang), "audio/wav", f"{job_id}_{lang}.wav", if_none_match, st)
+
+
+@app.head("/jobs/{job_id}/dubs/{lang}/video")
+def head_dub_video(job_id: str, lang: str, if_none_match: Optional[str] = Header(default=None)):
+    lang = (lang or "").strip().lower()
+    st = stat_artifact(dub_video_path(job_id, lang), 10_000) if lang in SUPPORTED_DUB_LANGS else None
+    if st is None:
+        return get_dub_video(job_id, lang, if_none_match)
+    return artifact_response(dub_video_path(job_id, lang), "video/mp4", f"{job_id}_{lang}.mp4", if_none_match, st)